@@ -8,6 +8,7 @@ Este script demonstra o uso dos módulos de relatórios:
 4. Dashboards HTML interativos
 """
 
+import logging
 import sys
 from pathlib import Path
 import pandas as pd
@@ -264,7 +265,7 @@ def demo_excel(cenarios):
             'N_Amostras': 25,
             'Media': 7.2,
             'Desvio_Padrao': 0.8,
-            'Diferenca_Percentual': '-7.8%',
+            'Diferenca_Percentual': -0.078,
             'P_value': 0.012,
             'Vies_Detectado': 'Sim'
         },
@@ -274,7 +275,7 @@ def demo_excel(cenarios):
             'N_Amostras': 25,
             'Media': 7.5,
             'Desvio_Padrao': 0.9,
-            'Diferenca_Percentual': '-4.2%',
+            'Diferenca_Percentual': -0.042,
             'P_value': 0.045,
             'Vies_Detectado': 'Sim'
         }
@@ -287,7 +288,7 @@ def demo_excel(cenarios):
             'Diferenca_Antes': 0.6,
             'Diferenca_Depois': 0.15,
             'Reducao_Absoluta': 0.45,
-            'Reducao_Percentual': '75.0%',
+            'Reducao_Percentual': 0.75,
             'Eficacia': 'Alta'
         },
         {
@@ -295,7 +296,7 @@ def demo_excel(cenarios):
             'Diferenca_Antes': 0.4,
             'Diferenca_Depois': 0.12,
             'Reducao_Absoluta': 0.28,
-            'Reducao_Percentual': '70.0%',
+            'Reducao_Percentual': 0.70,
             'Eficacia': 'Alta'
         }
     ])
@@ -443,4 +444,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Mensagens de progresso dos geradores que usam logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     main()
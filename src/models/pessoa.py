@@ -1,6 +1,7 @@
 """
 Modelo de dados para Pessoa com informações hierárquicas
 """
+import sys
 from dataclasses import dataclass, field
 from typing import Optional
 from datetime import datetime
@@ -29,7 +30,12 @@ class NivelHierarquico(Enum):
     C_LEVEL = 10
 
 
-@dataclass
+# __slots__ tira o __dict__ de cada instância (menos memória e criação mais
+# rápida em populações grandes); dataclass(slots=True) só existe no 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Pessoa:
     """
     Classe que representa uma pessoa na organização
@@ -2,10 +2,17 @@
 Módulo de Relatórios e Visualizações
 """
 
-from .graph_generator import GraphGenerator
-from .excel_generator import ExcelReportGenerator
-from .ppt_generator import PowerPointGenerator
-from .dashboard_generator import DashboardGenerator
+from importlib import import_module
+
+# Cada gerador só é importado quando acessado: matplotlib, openpyxl,
+# python-pptx e plotly levam centenas de ms para carregar, e quem usa um
+# único gerador não precisa pagar pelos outros
+_GERADORES = {
+    'GraphGenerator': '.graph_generator',
+    'ExcelReportGenerator': '.excel_generator',
+    'PowerPointGenerator': '.ppt_generator',
+    'DashboardGenerator': '.dashboard_generator',
+}
 
 __all__ = [
     'GraphGenerator',
@@ -13,3 +20,16 @@ __all__ = [
     'PowerPointGenerator',
     'DashboardGenerator'
 ]
+
+
+def __getattr__(nome: str):
+    modulo = _GERADORES.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    valor = getattr(import_module(modulo, __name__), nome)
+    globals()[nome] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_GERADORES))
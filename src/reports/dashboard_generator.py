@@ -13,6 +13,13 @@ from typing import Dict, List, Optional
 from datetime import datetime
 
 
+# Os traces são montados neste módulo a partir de dados já conhecidos, então a
+# validação de esquema do Plotly (refeita a cada propriedade atribuída) pode
+# ser desligada com segurança. O layout continua validado, pois é a validação
+# que resolve templates nomeados como "plotly_white".
+_VALIDAR = False
+
+
 class DashboardGenerator:
     """
     Gerador de dashboards HTML interativos com Plotly.
@@ -57,6 +64,7 @@ class DashboardGenerator:
             cor = self.cores.get(genero.lower(), '#999999')
 
             fig.add_trace(go.Violin(
+                _validate=_VALIDAR,
                 y=scores,
                 name=genero,
                 box_visible=True,
@@ -91,6 +99,7 @@ class DashboardGenerator:
 
         fig = go.Figure(data=[
             go.Bar(
+                _validate=_VALIDAR,
                 name='Antes da Correção',
                 x=generos,
                 y=[medias_antes[g] for g in generos],
@@ -103,6 +112,7 @@ class DashboardGenerator:
                              '<extra></extra>'
             ),
             go.Bar(
+                _validate=_VALIDAR,
                 name='Depois da Correção',
                 x=generos,
                 y=[medias_depois[g] for g in generos],
@@ -137,6 +147,7 @@ class DashboardGenerator:
 
         for tipo, scores in scores_por_tipo.items():
             fig.add_trace(go.Box(
+                _validate=_VALIDAR,
                 y=scores,
                 name=tipo,
                 boxmean='sd',
@@ -228,6 +239,7 @@ class DashboardGenerator:
         # Subgráfico 1: Diferença de médias
         fig.add_trace(
             go.Bar(
+                _validate=_VALIDAR,
                 x=['Antes', 'Depois'],
                 y=[abs(diferenca_antes), abs(diferenca_depois)],
                 marker_color=['#E74C3C', '#27AE60'],
@@ -245,6 +257,7 @@ class DashboardGenerator:
 
         fig.add_trace(
             go.Bar(
+                _validate=_VALIDAR,
                 x=['Antes', 'Depois'],
                 y=[p_value_antes, p_value_depois],
                 marker_color=cores_p,
@@ -286,6 +299,7 @@ class DashboardGenerator:
 
         # Histograma
         fig.add_trace(go.Histogram(
+            _validate=_VALIDAR,
             x=scores,
             nbinsx=bins,
             name='Frequência',
@@ -341,6 +355,7 @@ class DashboardGenerator:
                 cores.append(self.cores['neutro'])
 
         fig = go.Figure(go.Bar(
+            _validate=_VALIDAR,
             x=dados_mudancas['Mudanca'],
             y=dados_mudancas['Nome'],
             orientation='h',
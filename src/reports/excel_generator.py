@@ -3,14 +3,21 @@ Gerador de Relatórios Excel Formatados
 Gera Excel com múltiplas abas, formatação profissional e conditional formatting
 """
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle, DEFAULT_FONT
+from openpyxl.utils import get_column_letter
 from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.formatting.rule import CellIsRule
+from openpyxl.formatting.rule import CellIsRule, FormulaRule
+
+logger = logging.getLogger(__name__)
 
 
 class ExcelReportGenerator:
@@ -22,8 +29,17 @@ class ExcelReportGenerator:
     2. Detecção de Viés (com conditional formatting)
     3. Eficácia da Correção (com % em verde/vermelho)
     4. Mudanças de Posição (com setas ↑↓)
+
+    O arquivo pode ser escrito com openpyxl (padrão) ou xlsxwriter.
     """
 
+    # Casas decimais exibidas para as métricas do Resumo Executivo
+    CASAS_RESUMO = {'Média Feminino': 2, 'Média Masculino': 2, 'Diferença': 3, 'P-value': 4}
+
+    # Largura do conteúdo de colunas numéricas (o formato General do Excel
+    # exibe até 11 caracteres)
+    LARGURA_NUMERICA = 12
+
     def __init__(self, output_dir: str = "reports/excel"):
         """
         Inicializa o gerador de Excel.
@@ -32,8 +48,10 @@ class ExcelReportGenerator:
             output_dir: Diretório para salvar os arquivos Excel
         """
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        # Diretório e timestamp só são criados quando o relatório é salvo
+        self._dir_ready = False
+        self._timestamp = None
 
         # Estilos padrão
         self.header_font = Font(name='Arial', size=12, bold=True, color='FFFFFF')
@@ -42,6 +60,12 @@ class ExcelReportGenerator:
 
         self.cell_font = Font(name='Arial', size=10)
         self.cell_alignment = Alignment(horizontal='left', vertical='center')
+        self.center_alignment = Alignment(horizontal='center', vertical='center')
+
+        self.title_font = Font(name='Arial', size=16, bold=True, color='366092')
+        self.subtitle_font = Font(name='Arial', size=14, bold=True, color='366092')
+        self.section_font = Font(name='Arial', size=12, bold=True, color='366092')
+        self.section_fill = PatternFill(start_color='E7E6E6', end_color='E7E6E6', fill_type='solid')
 
         self.border = Border(
             left=Side(style='thin'),
@@ -50,29 +74,193 @@ class ExcelReportGenerator:
             bottom=Side(style='thin')
         )
 
-    def _formatar_header(self, ws, row: int = 1):
-        """Aplica formatação ao cabeçalho"""
-        for cell in ws[row]:
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = self.header_alignment
-            cell.border = self.border
-
-    def _ajustar_largura_colunas(self, ws):
-        """Ajusta largura das colunas automaticamente"""
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        # Estilos do conditional formatting, compartilhados por todas as
+        # células que recebem a mesma cor
+        self.fill_green = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
+        self.fill_yellow = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
+        self.fill_red = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
+
+        self.font_green_bold = Font(name='Arial', size=10, bold=True, color='006100')
+        self.font_yellow_bold = Font(name='Arial', size=10, bold=True, color='9C5700')
+        self.font_red_bold = Font(name='Arial', size=10, bold=True, color='9C0006')
+        self.font_green_bold_11 = Font(name='Arial', size=11, bold=True, color='006100')
+        self.font_red_bold_11 = Font(name='Arial', size=11, bold=True, color='9C0006')
+
+        # Fontes das regras de conditional formatting gravadas no arquivo
+        # (regras só aceitam cor/estilo, não nome e tamanho da fonte)
+        self.rule_font_green = Font(bold=True, color='006100')
+        self.rule_font_red = Font(bold=True, color='9C0006')
+
+    @property
+    def timestamp(self) -> str:
+        """Timestamp usado no nome do arquivo, calculado na primeira leitura"""
+        if self._timestamp is None:
+            self._timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return self._timestamp
+
+    def _registrar_estilos(self, wb):
+        """
+        Registra no workbook os estilos nomeados das células (uma vez por workbook).
+
+        Cada célula recebe o estilo por nome, numa única atribuição, em vez
+        de fonte, preenchimento, alinhamento e borda separados; o arquivo
+        grava cada estilo uma vez e as células só o referenciam.
+        """
+        if 'bias_data' in wb.named_styles:
+            return
+
+        base = {'alignment': self.center_alignment, 'border': self.border}
+        estilos = [
+            NamedStyle(name='bias_header', font=self.header_font, fill=self.header_fill,
+                       alignment=self.header_alignment, border=self.border),
+            NamedStyle(name='bias_data', font=DEFAULT_FONT, **base),
+            NamedStyle(name='bias_green_11', fill=self.fill_green, font=self.font_green_bold_11, **base),
+            NamedStyle(name='bias_red_11', fill=self.fill_red, font=self.font_red_bold_11, **base)
+        ]
+        for cor, fill, font in [('green', self.fill_green, self.font_green_bold),
+                                ('yellow', self.fill_yellow, self.font_yellow_bold),
+                                ('red', self.fill_red, self.font_red_bold)]:
+            estilos.append(NamedStyle(name=f'bias_{cor}', fill=fill, font=font, **base))
+            estilos.append(NamedStyle(name=f'bias_{cor}_fill', fill=fill, font=DEFAULT_FONT, **base))
+
+        for estilo in estilos:
+            wb.add_named_style(estilo)
+
+    def _formatar_header(self, ws, headers: List[str]) -> List[WriteOnlyCell]:
+        """Cria as células formatadas do cabeçalho"""
+        return [self._celula(ws, header, 'bias_header') for header in headers]
+
+    def _celula(self, ws, valor, estilo: str = 'bias_data') -> WriteOnlyCell:
+        """Cria uma célula com um dos estilos nomeados (padrão: dado com borda, centralizado)"""
+        cell = WriteOnlyCell(ws, value=valor)
+        cell.style = estilo
+        return cell
+
+    @staticmethod
+    def _coluna_percentual(coluna: pd.Series) -> pd.Series:
+        """
+        Normaliza uma coluna de percentuais para frações (0.123 = 12.3%).
+
+        Colunas numéricas já são frações e passam direto; textos legados
+        como '12.3%' são convertidos uma única vez (NaN se inválidos).
+        """
+        if pd.api.types.is_numeric_dtype(coluna):
+            return coluna.astype(float)
+        numeros = pd.to_numeric(coluna.astype(str).str.strip().str.rstrip('%'), errors='coerce')
+        return numeros / 100
+
+    def _escrever_titulo(self, ws, titulo: str, font: Font, n_colunas: int):
+        """Escreve o título mesclado na linha 1 seguido de uma linha em branco"""
+        cell = WriteOnlyCell(ws, value=titulo)
+        cell.font = font
+        cell.alignment = self.center_alignment
+        ws.append([cell])
+        ws.merged_cells.add(f'A1:{get_column_letter(n_colunas)}1')
+        ws.append([])
+
+    def _larguras_colunas(self, df: pd.DataFrame) -> List[int]:
+        """
+        Calcula a largura de cada coluna a partir do DataFrame que será escrito.
+
+        Só colunas de texto são medidas (str.len vetorizado do pandas);
+        colunas numéricas usam LARGURA_NUMERICA, sem converter os valores.
+        """
+        larguras = df.columns.astype(str).str.len().to_numpy()
+        if len(df):
+            conteudo = np.full(len(df.columns), self.LARGURA_NUMERICA)
+            numericas = np.array([pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes], dtype=bool)
+            for col_idx in np.flatnonzero(~numericas):
+                conteudo[col_idx] = df.iloc[:, col_idx].astype(str).str.len().max()
+            larguras = np.maximum(larguras, conteudo)
+
+        return np.minimum(larguras + 2, 50).tolist()
+
+    def _ajustar_largura_colunas(self, ws, larguras: List[int]):
+        """
+        Ajusta largura das colunas de uma aba openpyxl.
+
+        Em modo write-only as larguras precisam ser definidas antes da
+        primeira linha, por isso vêm calculadas sobre o DataFrame.
+        """
+        for col_idx, largura in enumerate(larguras, 1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = largura
+
+    # Os métodos _preparar_* só usam pandas/NumPy e não tocam no workbook,
+    # então podem rodar em paralelo; retornam os argumentos do escritor da aba
+
+    def _preparar_resumo(self, dados_cenarios: Dict[str, Dict[str, float]]):
+        """
+        Monta a tabela da aba Resumo Executivo, uma linha por cenário.
+
+        As métricas continuam numéricas; as casas decimais de CASAS_RESUMO
+        são aplicadas pelo number_format do Excel.
+        """
+        colunas = list(self.CASAS_RESUMO) + ['Viés Detectado']
+        tabela = pd.DataFrame.from_dict(dados_cenarios, orient='index').reindex(columns=colunas)
+        tabela = tabela.fillna({**dict.fromkeys(self.CASAS_RESUMO, 0), 'Viés Detectado': 'N/A'})
+        tabela = tabela.rename_axis('Cenário').reset_index()
+
+        return tabela, self._larguras_colunas(tabela)
+
+    def _preparar_deteccao(self, dados_deteccao: pd.DataFrame):
+        """Normaliza a Diferença Percentual da aba Detecção de Viés"""
+        # Percentuais ficam numéricos; o Excel exibe o "%" pelo number_format
+        dados_deteccao = dados_deteccao.assign(
+            Diferenca_Percentual=self._coluna_percentual(dados_deteccao['Diferenca_Percentual'])
+        )
+        return dados_deteccao, self._larguras_colunas(dados_deteccao)
+
+    def _preparar_eficacia(self, dados_eficacia: pd.DataFrame):
+        """
+        Normaliza a Redução Percentual e decide as cores da aba Eficácia.
+
+        As cores são decididas de uma vez sobre o DataFrame: cada linha
+        recebe um índice na tabela de estilos
+        (0 = vermelho, 1 = amarelo, 2 = verde, -1 = sem cor).
+        """
+        # Percentuais ficam numéricos; o Excel exibe o "%" pelo number_format
+        reducao = self._coluna_percentual(dados_eficacia['Reducao_Percentual'])
+        dados_eficacia = dados_eficacia.assign(Reducao_Percentual=reducao)
+
+        # Redução Percentual (coluna E)
+        # Verde: > 50%, Amarelo: 25-50%, Vermelho: < 25%
+        cat_reducao = pd.cut(
+            reducao, bins=[-np.inf, 0.25, 0.50, np.inf], right=False, labels=False
+        ).fillna(-1).astype(int).to_numpy()
+
+        # Eficácia (coluna F)
+        cat_eficacia = dados_eficacia['Eficacia'].map(
+            {'Baixa': 0, 'Média': 1, 'Alta': 2}
+        ).fillna(-1).astype(int).to_numpy()
+
+        return dados_eficacia, self._larguras_colunas(dados_eficacia), cat_reducao, cat_eficacia
+
+    def _preparar_mudancas(self, dados_mudancas: pd.DataFrame):
+        """
+        Escreve as setas na coluna Mudanca e a direção na coluna Direcao.
+
+        Setas, direção e cores são decididas de uma vez sobre o DataFrame:
+        cada linha recebe um índice na tabela de estilos
+        (0 = desceu, 1 = manteve, 2 = subiu, -1 = valor inválido, sem cor).
+        As larguras seguem os valores originais, sem as setas.
+        """
+        larguras = self._larguras_colunas(dados_mudancas)
+
+        mudanca = pd.to_numeric(dados_mudancas['Mudanca'], errors='coerce')
+        valida = mudanca.notna().to_numpy()
+        sentido = np.sign(mudanca.fillna(0)).astype(int).to_numpy()
+        modulo = mudanca.abs().fillna(0).astype(int).astype(str).to_numpy(dtype=object)
+
+        setas = np.select([sentido > 0, sentido < 0], ['↑ ' + modulo, '↓ ' + modulo], '→ 0')
+        direcoes = np.select([sentido > 0, sentido < 0], ['Subiu', 'Desceu'], 'Manteve')
+
+        # Valores inválidos são mantidos como vieram
+        dados_mudancas = dados_mudancas.assign(
+            Mudanca=np.where(valida, setas, dados_mudancas['Mudanca'].to_numpy(dtype=object)),
+            Direcao=np.where(valida, direcoes, dados_mudancas['Direcao'].to_numpy(dtype=object))
+        )
+
+        return dados_mudancas, larguras, np.where(valida, sentido + 1, -1)
 
     def aba_resumo_executivo(
         self,
@@ -83,7 +271,7 @@ class ExcelReportGenerator:
         Aba 1: Resumo Executivo
 
         Args:
-            wb: Workbook do openpyxl
+            wb: Workbook do openpyxl (modo write-only)
             dados_cenarios: Dados dos cenários (qualquer número)
                 {
                     'Cenário 1 - Sem Correção': {
@@ -97,75 +285,49 @@ class ExcelReportGenerator:
                     ...
                 }
         """
+        self._escrever_resumo_executivo(wb, *self._preparar_resumo(dados_cenarios))
+
+    def _escrever_resumo_executivo(self, wb, tabela: pd.DataFrame, larguras: List[int]):
+        """Escreve a aba Resumo Executivo já preparada (openpyxl)"""
+        self._registrar_estilos(wb)
         ws = wb.create_sheet("Resumo Executivo", 0)
 
-        # Título
-        ws['A1'] = 'RESUMO EXECUTIVO - ANÁLISE DE VIÉS'
-        ws['A1'].font = Font(name='Arial', size=16, bold=True, color='366092')
-        ws.merge_cells('A1:F1')
-        ws['A1'].alignment = Alignment(horizontal='center', vertical='center')
+        self._ajustar_largura_colunas(ws, larguras)
 
-        # Linha em branco
-        ws.append([])
+        # Título
+        self._escrever_titulo(
+            ws, 'RESUMO EXECUTIVO - ANÁLISE DE VIÉS',
+            self.title_font, len(tabela.columns)
+        )
 
         # Cabeçalhos
-        headers = ['Cenário', 'Média Feminino', 'Média Masculino',
-                  'Diferença', 'P-value', 'Viés Detectado']
-        ws.append(headers)
-        self._formatar_header(ws, row=3)
-
-        # Dados
-        for cenario, metricas in dados_cenarios.items():
-            row = [
-                cenario,
-                f"{metricas.get('Média Feminino', 0):.2f}",
-                f"{metricas.get('Média Masculino', 0):.2f}",
-                f"{metricas.get('Diferença', 0):.3f}",
-                f"{metricas.get('P-value', 0):.4f}",
-                metricas.get('Viés Detectado', 'N/A')
-            ]
-            ws.append(row)
-
-        # Formatação das células de dados
-        for row in ws.iter_rows(min_row=4, max_row=ws.max_row):
-            for cell in row:
-                cell.border = self.border
-                cell.alignment = Alignment(horizontal='center', vertical='center')
-
-        # Conditional formatting para P-value
-        # Verde se > 0.05 (sem viés), vermelho se < 0.05 (com viés)
-        green_fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
-        red_fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-
-        # Aplica manualmente baseado no valor
-        for row_idx in range(4, ws.max_row + 1):
-            p_value_cell = ws.cell(row=row_idx, column=5)
-            vies_cell = ws.cell(row=row_idx, column=6)
+        ws.append(self._formatar_header(ws, list(tabela.columns)))
 
-            try:
-                p_val = float(p_value_cell.value)
-                if p_val < 0.05:
-                    p_value_cell.fill = red_fill
-                    vies_cell.fill = red_fill
-                    vies_cell.font = Font(name='Arial', size=10, bold=True, color='9C0006')
-                else:
-                    p_value_cell.fill = green_fill
-                    vies_cell.fill = green_fill
-                    vies_cell.font = Font(name='Arial', size=10, bold=True, color='006100')
-            except:
-                pass
+        # Dados com conditional formatting para P-value
+        # Verde se > 0.05 (sem viés), vermelho se < 0.05 (com viés)
+        formatos = [f"0.{'0' * casas}" for casas in self.CASAS_RESUMO.values()]
+        com_vies = (tabela['P-value'] < 0.05).to_numpy()
+        linhas = dataframe_to_rows(tabela, index=False, header=False)
+        for linha, vies in zip(linhas, com_vies):
+            cor = 'red' if vies else 'green'
+
+            cells = [self._celula(ws, valor) for valor in linha[:4]]
+            cells.append(self._celula(ws, linha[4], f'bias_{cor}_fill'))
+            cells.append(self._celula(ws, linha[5], f'bias_{cor}'))
+            for cell, formato in zip(cells[1:5], formatos):
+                cell.number_format = formato
+            ws.append(cells)
 
         # Adiciona resumo estatístico
         ws.append([])
-        ws.append(['ANÁLISE COMPARATIVA'])
-        summary_row = ws.max_row
-        ws.merge_cells(f'A{summary_row}:F{summary_row}')
-        ws[f'A{summary_row}'].font = Font(name='Arial', size=12, bold=True, color='366092')
-        ws[f'A{summary_row}'].fill = PatternFill(start_color='E7E6E6', end_color='E7E6E6', fill_type='solid')
-
-        self._ajustar_largura_colunas(ws)
+        summary_row = 3 + len(tabela) + 2
+        summary_cell = WriteOnlyCell(ws, value='ANÁLISE COMPARATIVA')
+        summary_cell.font = self.section_font
+        summary_cell.fill = self.section_fill
+        ws.append([summary_cell])
+        ws.merged_cells.add(f'A{summary_row}:F{summary_row}')
 
-        print("✓ Aba 'Resumo Executivo' criada")
+        logger.info("✓ Aba 'Resumo Executivo' criada")
 
     def aba_deteccao_vies(
         self,
@@ -176,79 +338,67 @@ class ExcelReportGenerator:
         Aba 2: Detecção de Viés
 
         Args:
-            wb: Workbook do openpyxl
+            wb: Workbook do openpyxl (modo write-only)
             dados_deteccao: DataFrame com colunas:
                 ['Tipo_Avaliacao', 'Genero', 'N_Amostras', 'Media', 'Desvio_Padrao',
                  'Diferenca_Percentual', 'P_value', 'Vies_Detectado']
+                Diferenca_Percentual é uma fração (-0.078 = -7.8%); textos
+                como '-7.8%' também são aceitos.
         """
-        ws = wb.create_sheet("Detecção de Viés")
+        self._escrever_deteccao_vies(wb, *self._preparar_deteccao(dados_deteccao))
 
-        # Título
-        ws['A1'] = 'DETECÇÃO DE VIÉS POR TIPO DE AVALIAÇÃO'
-        ws['A1'].font = Font(name='Arial', size=14, bold=True, color='366092')
-        ws.merge_cells('A1:H1')
-        ws['A1'].alignment = Alignment(horizontal='center', vertical='center')
-
-        ws.append([])
-
-        # Escreve DataFrame
-        for r in dataframe_to_rows(dados_deteccao, index=False, header=True):
-            ws.append(r)
+    def _escrever_deteccao_vies(self, wb, dados_deteccao: pd.DataFrame, larguras: List[int]):
+        """Escreve a aba Detecção de Viés já preparada (openpyxl)"""
+        self._registrar_estilos(wb)
+        ws = wb.create_sheet("Detecção de Viés")
 
-        # Formata cabeçalho
-        self._formatar_header(ws, row=3)
+        self._ajustar_largura_colunas(ws, larguras)
 
-        # Formata células de dados
-        for row in ws.iter_rows(min_row=4, max_row=ws.max_row):
-            for cell in row:
-                cell.border = self.border
-                cell.alignment = Alignment(horizontal='center', vertical='center')
+        # Título
+        self._escrever_titulo(
+            ws, 'DETECÇÃO DE VIÉS POR TIPO DE AVALIAÇÃO',
+            self.subtitle_font, 8
+        )
 
-        # Conditional formatting
-
-        # 1. Diferença Percentual (coluna F)
-        # Verde: -5% a +5%, Amarelo: -10% a -5% ou +5% a +10%, Vermelho: < -10% ou > +10%
-        for row_idx in range(4, ws.max_row + 1):
-            diff_cell = ws.cell(row=row_idx, column=6)
-            try:
-                # Remove % e converte
-                diff_val = float(str(diff_cell.value).replace('%', ''))
-
-                if -5 <= diff_val <= 5:
-                    diff_cell.fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
-                elif -10 <= diff_val < -5 or 5 < diff_val <= 10:
-                    diff_cell.fill = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
-                else:
-                    diff_cell.fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-            except:
-                pass
-
-        # 2. P-value (coluna G)
-        # Verde se > 0.05, vermelho se < 0.05
-        for row_idx in range(4, ws.max_row + 1):
-            p_cell = ws.cell(row=row_idx, column=7)
-            try:
-                p_val = float(p_cell.value)
-                if p_val < 0.05:
-                    p_cell.fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-                else:
-                    p_cell.fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
-            except:
-                pass
-
-        # 3. Viés Detectado (coluna H)
-        for row_idx in range(4, ws.max_row + 1):
-            vies_cell = ws.cell(row=row_idx, column=8)
-            if vies_cell.value == 'Sim':
-                vies_cell.fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-                vies_cell.font = Font(name='Arial', size=10, bold=True, color='9C0006')
-            elif vies_cell.value == 'Não':
-                vies_cell.fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
-                vies_cell.font = Font(name='Arial', size=10, bold=True, color='006100')
-
-        self._ajustar_largura_colunas(ws)
-
-        print("✓ Aba 'Detecção de Viés' criada")
+        # Cabeçalho
+        ws.append(self._formatar_header(ws, list(dados_deteccao.columns)))
+
+        # Dados: linhas geradas sob demanda e gravadas em disco a cada append
+        for linha in dataframe_to_rows(dados_deteccao, index=False, header=False):
+            cells = [self._celula(ws, valor) for valor in linha]
+            cells[5].number_format = '0.0%'
+            ws.append(cells)
+
+        # Conditional formatting gravado como regras no arquivo, avaliadas
+        # pelo próprio Excel em vez de pintar célula a célula
+        ultima_linha = 3 + len(dados_deteccao)
+        if ultima_linha >= 4:
+            # 1. Diferença Percentual (coluna F)
+            # Verde: -5% a +5%, Amarelo: -10% a -5% ou +5% a +10%, Vermelho: < -10% ou > +10%
+            faixa = f'F4:F{ultima_linha}'
+            ws.conditional_formatting.add(faixa, CellIsRule(
+                operator='between', formula=['-0.05', '0.05'], fill=self.fill_green, stopIfTrue=True))
+            ws.conditional_formatting.add(faixa, CellIsRule(
+                operator='between', formula=['-0.1', '0.1'], fill=self.fill_yellow, stopIfTrue=True))
+            ws.conditional_formatting.add(faixa, CellIsRule(
+                operator='notBetween', formula=['-0.1', '0.1'], fill=self.fill_red))
+
+            # 2. P-value (coluna G)
+            # Verde se > 0.05, vermelho se < 0.05
+            faixa = f'G4:G{ultima_linha}'
+            ws.conditional_formatting.add(faixa, CellIsRule(
+                operator='lessThan', formula=['0.05'], fill=self.fill_red))
+            ws.conditional_formatting.add(faixa, CellIsRule(
+                operator='greaterThanOrEqual', formula=['0.05'], fill=self.fill_green))
+
+            # 3. Viés Detectado (coluna H)
+            faixa = f'H4:H{ultima_linha}'
+            ws.conditional_formatting.add(faixa, FormulaRule(
+                formula=['$H4="Sim"'], fill=self.fill_red, font=self.rule_font_red))
+            ws.conditional_formatting.add(faixa, FormulaRule(
+                formula=['$H4="Não"'], fill=self.fill_green, font=self.rule_font_green))
+
+        logger.info("✓ Aba 'Detecção de Viés' criada")
 
     def aba_eficacia_correcao(
         self,
@@ -259,70 +409,46 @@ class ExcelReportGenerator:
         Aba 3: Eficácia da Correção
 
         Args:
-            wb: Workbook do openpyxl
+            wb: Workbook do openpyxl (modo write-only)
             dados_eficacia: DataFrame com colunas:
                 ['Tipo_Avaliacao', 'Diferenca_Antes', 'Diferenca_Depois',
                  'Reducao_Absoluta', 'Reducao_Percentual', 'Eficacia']
+                Reducao_Percentual é uma fração (0.75 = 75%); textos como
+                '75.0%' também são aceitos.
         """
+        self._escrever_eficacia_correcao(wb, *self._preparar_eficacia(dados_eficacia))
+
+    def _escrever_eficacia_correcao(self, wb, dados_eficacia: pd.DataFrame, larguras: List[int],
+                                    cat_reducao: np.ndarray, cat_eficacia: np.ndarray):
+        """Escreve a aba Eficácia da Correção já preparada (openpyxl)"""
+        self._registrar_estilos(wb)
         ws = wb.create_sheet("Eficácia da Correção")
 
-        # Título
-        ws['A1'] = 'EFICÁCIA DA CORREÇÃO DE VIÉS'
-        ws['A1'].font = Font(name='Arial', size=14, bold=True, color='366092')
-        ws.merge_cells('A1:F1')
-        ws['A1'].alignment = Alignment(horizontal='center', vertical='center')
+        self._ajustar_largura_colunas(ws, larguras)
 
-        ws.append([])
+        # Título
+        self._escrever_titulo(
+            ws, 'EFICÁCIA DA CORREÇÃO DE VIÉS',
+            self.subtitle_font, 6
+        )
 
-        # Escreve DataFrame
-        for r in dataframe_to_rows(dados_eficacia, index=False, header=True):
-            ws.append(r)
+        # Cabeçalho
+        ws.append(self._formatar_header(ws, list(dados_eficacia.columns)))
 
-        # Formata cabeçalho
-        self._formatar_header(ws, row=3)
+        # Tabela de estilos indexada pelas categorias de _preparar_eficacia
+        estilos = ['bias_red', 'bias_yellow', 'bias_green']
 
-        # Formata células de dados
-        for row in ws.iter_rows(min_row=4, max_row=ws.max_row):
-            for cell in row:
-                cell.border = self.border
-                cell.alignment = Alignment(horizontal='center', vertical='center')
+        linhas = dataframe_to_rows(dados_eficacia, index=False, header=False)
+        for linha, cat_r, cat_e in zip(linhas, cat_reducao, cat_eficacia):
+            cells = [self._celula(ws, valor) for valor in linha]
+            if cat_r >= 0:
+                cells[4].style = estilos[cat_r]
+            if cat_e >= 0:
+                cells[5].style = estilos[cat_e]
+            cells[4].number_format = '0.0%'
+            ws.append(cells)
 
-        # Conditional formatting para Redução Percentual (coluna E)
-        # Verde: > 50%, Amarelo: 25-50%, Vermelho: < 25%
-        for row_idx in range(4, ws.max_row + 1):
-            red_cell = ws.cell(row=row_idx, column=5)
-            try:
-                # Remove % e converte
-                red_val = float(str(red_cell.value).replace('%', ''))
-
-                if red_val >= 50:
-                    red_cell.fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
-                    red_cell.font = Font(name='Arial', size=10, bold=True, color='006100')
-                elif 25 <= red_val < 50:
-                    red_cell.fill = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
-                    red_cell.font = Font(name='Arial', size=10, bold=True, color='9C5700')
-                else:
-                    red_cell.fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-                    red_cell.font = Font(name='Arial', size=10, bold=True, color='9C0006')
-            except:
-                pass
-
-        # Conditional formatting para Eficácia (coluna F)
-        for row_idx in range(4, ws.max_row + 1):
-            ef_cell = ws.cell(row=row_idx, column=6)
-            if ef_cell.value == 'Alta':
-                ef_cell.fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
-                ef_cell.font = Font(name='Arial', size=10, bold=True, color='006100')
-            elif ef_cell.value == 'Média':
-                ef_cell.fill = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
-                ef_cell.font = Font(name='Arial', size=10, bold=True, color='9C5700')
-            elif ef_cell.value == 'Baixa':
-                ef_cell.fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-                ef_cell.font = Font(name='Arial', size=10, bold=True, color='9C0006')
-
-        self._ajustar_largura_colunas(ws)
-
-        print("✓ Aba 'Eficácia da Correção' criada")
+        logger.info("✓ Aba 'Eficácia da Correção' criada")
 
     def aba_mudancas_posicao(
         self,
@@ -333,69 +459,226 @@ class ExcelReportGenerator:
         Aba 4: Mudanças de Posição
 
         Args:
-            wb: Workbook do openpyxl
+            wb: Workbook do openpyxl (modo write-only)
             dados_mudancas: DataFrame com colunas:
                 ['Pessoa_ID', 'Nome', 'Genero', 'Posicao_Antes', 'Posicao_Depois',
                  'Mudanca', 'Direcao']
         """
+        self._escrever_mudancas_posicao(wb, *self._preparar_mudancas(dados_mudancas))
+
+    def _escrever_mudancas_posicao(self, wb, dados_mudancas: pd.DataFrame, larguras: List[int],
+                                   categorias: np.ndarray):
+        """Escreve a aba Mudanças de Posição já preparada (openpyxl)"""
+        self._registrar_estilos(wb)
         ws = wb.create_sheet("Mudanças de Posição")
 
+        self._ajustar_largura_colunas(ws, larguras)
+
+        estilos = [
+            ('bias_red_11', 'bias_red_fill'),
+            ('bias_yellow_fill', 'bias_yellow_fill'),
+            ('bias_green_11', 'bias_green_fill')
+        ]
+
         # Título
-        ws['A1'] = 'MUDANÇAS DE POSIÇÃO NO RANKING'
-        ws['A1'].font = Font(name='Arial', size=14, bold=True, color='366092')
-        ws.merge_cells('A1:G1')
-        ws['A1'].alignment = Alignment(horizontal='center', vertical='center')
+        self._escrever_titulo(
+            ws, 'MUDANÇAS DE POSIÇÃO NO RANKING',
+            self.subtitle_font, 7
+        )
 
-        ws.append([])
+        # Cabeçalho
+        ws.append(self._formatar_header(ws, list(dados_mudancas.columns)))
+
+        linhas = dataframe_to_rows(dados_mudancas, index=False, header=False)
+        for linha, cat in zip(linhas, categorias):
+            estilo_mudanca, estilo_direcao = estilos[cat] if cat >= 0 else ('bias_data', 'bias_data')
+            cells = [self._celula(ws, valor) for valor in linha[:5]]
+            cells.append(self._celula(ws, linha[5], estilo_mudanca))
+            cells.append(self._celula(ws, linha[6], estilo_direcao))
+            ws.append(cells)
+
+        logger.info("✓ Aba 'Mudanças de Posição' criada")
+
+    def _criar_formatos_xlsxwriter(self, wb) -> Dict[str, object]:
+        """Cria uma única vez os formatos compartilhados do backend xlsxwriter"""
+        celula = {'border': 1, 'align': 'center', 'valign': 'vcenter'}
+        cores = {'verde': ('#C6EFCE', '#006100'),
+                 'amarelo': ('#FFEB9C', '#9C5700'),
+                 'vermelho': ('#FFC7CE', '#9C0006')}
+
+        formatos = {
+            'titulo_16': wb.add_format({'font_name': 'Arial', 'font_size': 16, 'bold': True,
+                                        'font_color': '#366092', 'align': 'center', 'valign': 'vcenter'}),
+            'titulo_14': wb.add_format({'font_name': 'Arial', 'font_size': 14, 'bold': True,
+                                        'font_color': '#366092', 'align': 'center', 'valign': 'vcenter'}),
+            'secao': wb.add_format({'font_name': 'Arial', 'font_size': 12, 'bold': True,
+                                    'font_color': '#366092', 'bg_color': '#E7E6E6'}),
+            'header': wb.add_format({'font_name': 'Arial', 'font_size': 12, 'bold': True,
+                                     'font_color': '#FFFFFF', 'bg_color': '#366092',
+                                     'text_wrap': True, **celula}),
+            # Formatos de coluna: valem para os valores escritos pelo to_excel
+            'alinhamento': wb.add_format({'align': 'center', 'valign': 'vcenter'}),
+            'regra_borda': wb.add_format({'border': 1}),
+        }
+
+        for nome, (fundo, texto) in cores.items():
+            negrito = {'font_name': 'Arial', 'bold': True, 'font_color': texto}
+            formatos[nome] = wb.add_format({'bg_color': fundo, **celula})
+            formatos[f'{nome}_pvalue'] = wb.add_format(
+                {'bg_color': fundo, 'num_format': '0.0000', **celula})
+            formatos[f'{nome}_negrito'] = wb.add_format(
+                {'bg_color': fundo, 'font_size': 10, **negrito, **celula})
+            formatos[f'{nome}_negrito_pct'] = wb.add_format(
+                {'bg_color': fundo, 'font_size': 10, 'num_format': '0.0%', **negrito, **celula})
+            formatos[f'{nome}_negrito_11'] = wb.add_format(
+                {'bg_color': fundo, 'font_size': 11, **negrito, **celula})
+
+            # Formatos das regras de conditional formatting
+            formatos[f'regra_{nome}'] = wb.add_format({'bg_color': fundo})
+            formatos[f'regra_{nome}_negrito'] = wb.add_format(
+                {'bg_color': fundo, 'bold': True, 'font_color': texto})
+
+        return formatos
+
+    def _xw_escrever_aba(self, writer, nome: str, titulo: str, formato_titulo: str,
+                         df: pd.DataFrame, larguras: List[int],
+                         formatos_numero: Optional[Dict[int, str]] = None):
+        """
+        Escreve o DataFrame numa aba xlsxwriter com to_excel, a partir da linha 3.
 
-        # Escreve DataFrame
-        for r in dataframe_to_rows(dados_mudancas, index=False, header=True):
-            ws.append(r)
+        Os valores vão em bloco pelo pandas; alinhamento e formato numérico
+        (formatos_numero: índice da coluna -> number_format) ficam no formato
+        da coluna e as bordas numa regra de conditional formatting limitada
+        às células de dados. Só as células coloridas precisam ser reescritas
+        depois.
+        """
+        fmt = self._xw_formatos
+        formatos_numero = formatos_numero or {}
+        ws = writer.book.add_worksheet(nome)
+
+        for col_idx, largura in enumerate(larguras):
+            num_format = formatos_numero.get(col_idx)
+            chave = f'alinhamento_{num_format}' if num_format else 'alinhamento'
+            if chave not in fmt:
+                fmt[chave] = writer.book.add_format(
+                    {'align': 'center', 'valign': 'vcenter', 'num_format': num_format})
+            ws.set_column(col_idx, col_idx, largura, fmt[chave])
+
+        df.to_excel(writer, sheet_name=nome, startrow=2, index=False)
+
+        ws.merge_range(0, 0, 0, len(df.columns) - 1, titulo, fmt[formato_titulo])
+        ws.write_row(2, 0, [str(coluna) for coluna in df.columns], fmt['header'])
+
+        # Primeira regra da aba: as demais (com stop_if_true) não a suprimem
+        if len(df):
+            ws.conditional_format(3, 0, 2 + len(df), len(df.columns) - 1,
+                                  {'type': 'no_errors', 'format': fmt['regra_borda']})
+        return ws
+
+    def _xw_resumo_executivo(self, writer, tabela: pd.DataFrame, larguras: List[int]):
+        """Aba 1: Resumo Executivo (backend xlsxwriter)"""
+        fmt = self._xw_formatos
+        formatos_numero = {col_idx: f"0.{'0' * casas}"
+                           for col_idx, casas in enumerate(self.CASAS_RESUMO.values(), 1)}
+        ws = self._xw_escrever_aba(
+            writer, "Resumo Executivo", 'RESUMO EXECUTIVO - ANÁLISE DE VIÉS', 'titulo_16',
+            tabela, larguras, formatos_numero=formatos_numero
+        )
 
-        # Formata cabeçalho
-        self._formatar_header(ws, row=3)
+        p_values = tabela['P-value'].to_numpy()
+        vies_detectado = tabela['Viés Detectado'].to_numpy()
+        for i, vies in enumerate(p_values < 0.05):
+            cor = 'vermelho' if vies else 'verde'
+            ws.write(3 + i, 4, p_values[i], fmt[f'{cor}_pvalue'])
+            ws.write(3 + i, 5, vies_detectado[i], fmt[f'{cor}_negrito'])
 
-        # Formata células de dados
-        for row in ws.iter_rows(min_row=4, max_row=ws.max_row):
-            for cell in row:
-                cell.border = self.border
-                cell.alignment = Alignment(horizontal='center', vertical='center')
+        summary_row = 3 + len(tabela) + 1
+        ws.merge_range(summary_row, 0, summary_row, 5, 'ANÁLISE COMPARATIVA', fmt['secao'])
 
-        # Adiciona setas na coluna Mudanca (coluna F)
-        for row_idx in range(4, ws.max_row + 1):
-            mudanca_cell = ws.cell(row=row_idx, column=6)
-            direcao_cell = ws.cell(row=row_idx, column=7)
+        logger.info("✓ Aba 'Resumo Executivo' criada")
 
-            try:
-                mudanca = int(mudanca_cell.value)
-                if mudanca > 0:
-                    mudanca_cell.value = f"↑ {mudanca}"
-                    mudanca_cell.fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
-                    mudanca_cell.font = Font(name='Arial', size=11, bold=True, color='006100')
-                    direcao_cell.value = "Subiu"
-                    direcao_cell.fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
-                elif mudanca < 0:
-                    mudanca_cell.value = f"↓ {abs(mudanca)}"
-                    mudanca_cell.fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-                    mudanca_cell.font = Font(name='Arial', size=11, bold=True, color='9C0006')
-                    direcao_cell.value = "Desceu"
-                    direcao_cell.fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-                else:
-                    mudanca_cell.value = "→ 0"
-                    mudanca_cell.fill = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
-                    direcao_cell.value = "Manteve"
-                    direcao_cell.fill = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
-            except:
-                pass
-
-        self._ajustar_largura_colunas(ws)
-
-        print("✓ Aba 'Mudanças de Posição' criada")
+    def _xw_deteccao_vies(self, writer, dados_deteccao: pd.DataFrame, larguras: List[int]):
+        """Aba 2: Detecção de Viés (backend xlsxwriter)"""
+        fmt = self._xw_formatos
+        ws = self._xw_escrever_aba(
+            writer, "Detecção de Viés", 'DETECÇÃO DE VIÉS POR TIPO DE AVALIAÇÃO', 'titulo_14',
+            dados_deteccao, larguras, formatos_numero={5: '0.0%'}
+        )
+
+        ultima_linha = 3 + len(dados_deteccao) - 1
+        if ultima_linha >= 3:
+            # 1. Diferença Percentual (coluna F)
+            ws.conditional_format(3, 5, ultima_linha, 5, {
+                'type': 'cell', 'criteria': 'between', 'minimum': -0.05, 'maximum': 0.05,
+                'format': fmt['regra_verde'], 'stop_if_true': True})
+            ws.conditional_format(3, 5, ultima_linha, 5, {
+                'type': 'cell', 'criteria': 'between', 'minimum': -0.1, 'maximum': 0.1,
+                'format': fmt['regra_amarelo'], 'stop_if_true': True})
+            ws.conditional_format(3, 5, ultima_linha, 5, {
+                'type': 'cell', 'criteria': 'not between', 'minimum': -0.1, 'maximum': 0.1,
+                'format': fmt['regra_vermelho']})
+
+            # 2. P-value (coluna G)
+            ws.conditional_format(3, 6, ultima_linha, 6, {
+                'type': 'cell', 'criteria': '<', 'value': 0.05, 'format': fmt['regra_vermelho']})
+            ws.conditional_format(3, 6, ultima_linha, 6, {
+                'type': 'cell', 'criteria': '>=', 'value': 0.05, 'format': fmt['regra_verde']})
+
+            # 3. Viés Detectado (coluna H)
+            ws.conditional_format(3, 7, ultima_linha, 7, {
+                'type': 'formula', 'criteria': '=$H4="Sim"', 'format': fmt['regra_vermelho_negrito']})
+            ws.conditional_format(3, 7, ultima_linha, 7, {
+                'type': 'formula', 'criteria': '=$H4="Não"', 'format': fmt['regra_verde_negrito']})
+
+        logger.info("✓ Aba 'Detecção de Viés' criada")
+
+    def _xw_eficacia_correcao(self, writer, dados_eficacia: pd.DataFrame, larguras: List[int],
+                              cat_reducao: np.ndarray, cat_eficacia: np.ndarray):
+        """Aba 3: Eficácia da Correção (backend xlsxwriter)"""
+        fmt = self._xw_formatos
+        ws = self._xw_escrever_aba(
+            writer, "Eficácia da Correção", 'EFICÁCIA DA CORREÇÃO DE VIÉS', 'titulo_14',
+            dados_eficacia, larguras, formatos_numero={4: '0.0%'}
+        )
+
+        cores = ['vermelho', 'amarelo', 'verde']
+        reducao = dados_eficacia['Reducao_Percentual'].to_numpy()
+        eficacia = dados_eficacia['Eficacia'].to_numpy()
+        for i in np.flatnonzero(cat_reducao >= 0):
+            ws.write(3 + i, 4, reducao[i], fmt[f'{cores[cat_reducao[i]]}_negrito_pct'])
+        for i in np.flatnonzero(cat_eficacia >= 0):
+            ws.write(3 + i, 5, eficacia[i], fmt[f'{cores[cat_eficacia[i]]}_negrito'])
+
+        logger.info("✓ Aba 'Eficácia da Correção' criada")
+
+    def _xw_mudancas_posicao(self, writer, dados_mudancas: pd.DataFrame, larguras: List[int],
+                             categorias: np.ndarray):
+        """Aba 4: Mudanças de Posição (backend xlsxwriter)"""
+        fmt = self._xw_formatos
+        ws = self._xw_escrever_aba(
+            writer, "Mudanças de Posição", 'MUDANÇAS DE POSIÇÃO NO RANKING', 'titulo_14',
+            dados_mudancas, larguras
+        )
+
+        formatos = [
+            ('vermelho_negrito_11', 'vermelho'),
+            ('amarelo', 'amarelo'),
+            ('verde_negrito_11', 'verde')
+        ]
+        mudancas = dados_mudancas['Mudanca'].to_numpy()
+        direcoes = dados_mudancas['Direcao'].to_numpy()
+        for i in np.flatnonzero(categorias >= 0):
+            formato_mudanca, formato_direcao = formatos[categorias[i]]
+            ws.write(3 + i, 5, mudancas[i], fmt[formato_mudanca])
+            ws.write(3 + i, 6, direcoes[i], fmt[formato_direcao])
+
+        logger.info("✓ Aba 'Mudanças de Posição' criada")
 
     def gerar_relatorio_completo(
         self,
         dados_completos: Dict,
-        nome_arquivo: Optional[str] = None
+        nome_arquivo: Optional[str] = None,
+        backend: str = 'openpyxl'
     ) -> Path:
         """
         Gera relatório Excel completo com todas as abas.
@@ -409,6 +692,8 @@ class ExcelReportGenerator:
                     'mudancas_posicao': DataFrame
                 }
             nome_arquivo: Nome do arquivo (opcional)
+            backend: 'openpyxl' (padrão) ou 'xlsxwriter', que escreve os
+                DataFrames em bloco com to_excel e é mais rápido em abas grandes
 
         Returns:
             Path do arquivo gerado
@@ -416,44 +701,64 @@ class ExcelReportGenerator:
         if nome_arquivo is None:
             nome_arquivo = f"relatorio_vies_{self.timestamp}.xlsx"
 
-        caminho = self.output_dir / nome_arquivo
-
-        print("\n=== Gerando Relatório Excel ===\n")
+        if not self._dir_ready:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
 
-        # Cria workbook
-        wb = openpyxl.Workbook()
+        caminho = self.output_dir / nome_arquivo
 
-        # Remove a planilha padrão
-        wb.remove(wb.active)
+        logger.info("=== Gerando Relatório Excel ===")
+
+        if backend == 'openpyxl':
+            # Cria workbook em modo write-only: as linhas são gravadas em disco
+            # à medida que são adicionadas, sem manter a grade de células em memória
+            wb = openpyxl.Workbook(write_only=True)
+            escritores = {
+                'resumo_executivo': self._escrever_resumo_executivo,
+                'deteccao_vies': self._escrever_deteccao_vies,
+                'eficacia_correcao': self._escrever_eficacia_correcao,
+                'mudancas_posicao': self._escrever_mudancas_posicao
+            }
+        elif backend == 'xlsxwriter':
+            wb = pd.ExcelWriter(caminho, engine='xlsxwriter')
+            self._xw_formatos = self._criar_formatos_xlsxwriter(wb.book)
+            escritores = {
+                'resumo_executivo': self._xw_resumo_executivo,
+                'deteccao_vies': self._xw_deteccao_vies,
+                'eficacia_correcao': self._xw_eficacia_correcao,
+                'mudancas_posicao': self._xw_mudancas_posicao
+            }
+        else:
+            raise ValueError(f"Backend desconhecido: {backend} (use 'openpyxl' ou 'xlsxwriter')")
+
+        abas = {
+            'resumo_executivo': ('Resumo Executivo', self._preparar_resumo),
+            'deteccao_vies': ('Detecção de Viés', self._preparar_deteccao),
+            'eficacia_correcao': ('Eficácia da Correção', self._preparar_eficacia),
+            'mudancas_posicao': ('Mudanças de Posição', self._preparar_mudancas)
+        }
+
+        # Prepara os dados das abas em paralelo; a escrita continua sequencial
+        # porque as tabelas de estilos e strings do workbook não são thread-safe
+        with ThreadPoolExecutor(max_workers=len(abas)) as executor:
+            preparados = {
+                chave: executor.submit(preparar, dados_completos[chave])
+                for chave, (_, preparar) in abas.items() if chave in dados_completos
+            }
 
         # Cria abas
-        try:
-            if 'resumo_executivo' in dados_completos:
-                self.aba_resumo_executivo(wb, dados_completos['resumo_executivo'])
-        except Exception as e:
-            print(f"⚠ Erro ao criar aba Resumo Executivo: {e}")
-
-        try:
-            if 'deteccao_vies' in dados_completos:
-                self.aba_deteccao_vies(wb, dados_completos['deteccao_vies'])
-        except Exception as e:
-            print(f"⚠ Erro ao criar aba Detecção de Viés: {e}")
-
-        try:
-            if 'eficacia_correcao' in dados_completos:
-                self.aba_eficacia_correcao(wb, dados_completos['eficacia_correcao'])
-        except Exception as e:
-            print(f"⚠ Erro ao criar aba Eficácia da Correção: {e}")
-
-        try:
-            if 'mudancas_posicao' in dados_completos:
-                self.aba_mudancas_posicao(wb, dados_completos['mudancas_posicao'])
-        except Exception as e:
-            print(f"⚠ Erro ao criar aba Mudanças de Posição: {e}")
+        for chave, futuro in preparados.items():
+            try:
+                escritores[chave](wb, *futuro.result())
+            except Exception as e:
+                logger.warning("⚠ Erro ao criar aba %s: %s", abas[chave][0], e)
 
         # Salva arquivo
-        wb.save(caminho)
+        if backend == 'xlsxwriter':
+            wb.close()
+        else:
+            wb.save(caminho)
 
-        print(f"\n✓ Relatório Excel salvo: {caminho}")
+        logger.info("✓ Relatório Excel salvo: %s", caminho)
 
         return caminho
@@ -3,17 +3,118 @@ Gerador Automático de Gráficos - 8 Gráficos Essenciais
 Gera visualizações em alta resolução (PNG) a partir dos DataFrames do framework
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import hashlib
+import os
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from datetime import datetime
 
-# Configuração de estilo
-plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("husl")
+# Séries numéricas aceitas pela API: listas do framework ou arrays numpy
+# (convertidos uma única vez na entrada de cada gráfico)
+Valores = Union[Sequence[float], np.ndarray]
+
+# Margens padrão (fração da figura) aplicadas em _nova_figura
+_MARGENS_PADRAO = {'left': 0.07, 'right': 0.97, 'top': 0.9, 'bottom': 0.09}
+
+
+@lru_cache(maxsize=None)
+def _configurar_estilo():
+    """
+    Configuração de estilo, aplicada uma vez na primeira figura criada.
+    seaborn e pandas só são importados quando algum gráfico é gerado,
+    evitando o custo de import em quem apenas importa o pacote.
+    """
+    import seaborn as sns
+    matplotlib.style.use('seaborn-v0_8-darkgrid')
+    sns.set_palette("husl")
+
+
+@lru_cache(maxsize=None)
+def _cores_set3(n: int) -> np.ndarray:
+    """Paleta Set3 com n cores igualmente espaçadas (amostrada uma vez por n)"""
+    return matplotlib.colormaps['Set3'](np.linspace(0, 1, n))
+
+
+def _atualizar_hash(h, valor):
+    """
+    Alimenta o hash com o conteúdo de um argumento de gráfico. Dicts, listas
+    e tuplas são percorridos item a item e arrays entram pelos bytes, então
+    só escalares passam por repr (o repr de arrays grandes é resumido)
+    """
+    if isinstance(valor, dict):
+        h.update(b'{')
+        for chave, item in valor.items():
+            _atualizar_hash(h, chave)
+            _atualizar_hash(h, item)
+        h.update(b'}')
+    elif isinstance(valor, (list, tuple)):
+        h.update(b'[' if isinstance(valor, list) else b'(')
+        for item in valor:
+            _atualizar_hash(h, item)
+        h.update(b']' if isinstance(valor, list) else b')')
+    elif isinstance(valor, np.ndarray):
+        h.update(f'{valor.dtype.str}{valor.shape}'.encode())
+        if valor.dtype == object:
+            for item in valor.ravel().tolist():
+                _atualizar_hash(h, item)
+        else:
+            h.update(np.ascontiguousarray(valor).tobytes())
+    else:
+        h.update(repr(valor).encode())
+        h.update(b';')
+
+
+def _memoizar_render(metodo):
+    """
+    Reaproveita o PNG já gerado quando o gráfico é pedido de novo com as
+    mesmas entradas (chave BLAKE2b sobre os argumentos e as opções de render).
+    """
+    @wraps(metodo)
+    def wrapper(self, *args, **kwargs):
+        h = hashlib.blake2b(digest_size=16)
+        _atualizar_hash(h, (metodo.__name__, self.dpi, self.compress_level,
+                            self.max_overlay_points))
+        _atualizar_hash(h, args)
+        for nome in sorted(kwargs):
+            _atualizar_hash(h, nome)
+            _atualizar_hash(h, kwargs[nome])
+        chave = h.hexdigest()
+
+        caminho = self._render_cache.get(chave)
+        if caminho is not None and (caminho in self._salvamentos or caminho.exists()):
+            print(f"✓ Gráfico reaproveitado: {caminho}")
+            return caminho
+
+        caminho = metodo(self, *args, **kwargs)
+        # O arquivo foi sobrescrito: entradas antigas para ele ficam inválidas
+        self._render_cache = {k: v for k, v in self._render_cache.items() if v != caminho}
+        self._render_cache[chave] = caminho
+        return caminho
+    return wrapper
+
+
+def _estatisticas_histograma(ordenados: np.ndarray, pontos: int = 100):
+    """
+    Estatísticas do histograma a partir dos scores já ordenados.
+
+    Returns:
+        (mu, sigma, (p25, p50, p75), x, densidade) — percentis com interpolação
+        linear (idênticos a np.percentile) e densidade normal avaliada em x
+    """
+    # Reduções acumuladas em float64 mesmo com entrada float32
+    mu = ordenados.mean(dtype=np.float64)
+    sigma = ordenados.std(dtype=np.float64)
+    posicoes = np.array([0.25, 0.5, 0.75]) * (ordenados.size - 1)
+    percentis = np.interp(posicoes, np.arange(ordenados.size), ordenados)
+    x = np.linspace(ordenados[0], ordenados[-1], pontos)
+    densidade = np.exp(-0.5 * ((x - mu) / sigma) ** 2) / (sigma * np.sqrt(2.0 * np.pi))
+    return mu, sigma, tuple(percentis), x, densidade
 
 
 class GraphGenerator:
@@ -31,61 +132,174 @@ class GraphGenerator:
     8. Radar chart com múltiplos critérios
     """
 
-    def __init__(self, output_dir: str = "reports/graficos", dpi: int = 300):
+    # Gráficos do lote, em ordem: (método, chaves obrigatórias, chaves opcionais)
+    GRAFICOS = (
+        ('grafico_1_distribuicao_scores_antes', ('scores_antes_por_genero',), ()),
+        ('grafico_2_distribuicao_scores_depois', ('scores_depois_por_genero',), ()),
+        ('grafico_3_comparacao_medias', ('medias_antes', 'medias_depois'), ()),
+        ('grafico_4_boxplot_avaliacoes', ('scores_por_tipo',), ()),
+        ('grafico_5_eficacia_correcao', ('diferenca_antes', 'diferenca_depois',
+                                         'p_value_antes', 'p_value_depois'), ()),
+        ('grafico_6_histograma_distribuicao', ('todos_scores',), ()),
+        ('grafico_7_scatter_desempenho_potencial', ('desempenho', 'potencial'), ('generos',)),
+        ('grafico_8_comparativo_cenarios', ('cenarios',), ()),
+    )
+
+    def __init__(self, output_dir: str = "reports/graficos", dpi: int = 300,
+                 compress_level: int = 3, max_overlay_points: int = 2000):
         """
         Inicializa o gerador de gráficos.
 
         Args:
             output_dir: Diretório para salvar os gráficos
             dpi: Resolução dos gráficos (300 = alta qualidade)
+            compress_level: Nível zlib do PNG (0-9); 3 codifica bem mais
+                rápido que o padrão 6 com arquivos só um pouco maiores
+            max_overlay_points: Máximo de pontos individuais desenhados nos
+                gráficos 1, 2 e 7; acima disso usa amostra aleatória fixa
+                (violinos e estatísticas continuam usando todos os dados)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.dpi = dpi
+        self.compress_level = compress_level
+        self.max_overlay_points = max_overlay_points
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-    def _save_figure(self, fig: plt.Figure, nome: str):
+        # Preenchidos só durante gerar_todos_graficos: os PNGs são codificados
+        # em segundo plano enquanto o próximo gráfico é montado
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._salvamentos: Dict[Path, Future] = {}
+        self._figuras_livres: Dict[Tuple[float, float], List[Figure]] = {}
+        # Hash das entradas de cada gráfico -> PNG já gerado
+        self._render_cache: Dict[str, Path] = {}
+
+    def _nova_figura(self, figsize: Tuple[float, float], nrows: int = 1, ncols: int = 1):
+        """
+        Obtém figura com canvas Agg próprio, fora do gerenciador do pyplot.
+        Durante gerar_todos_graficos, figuras já gravadas voltam para um pool
+        por tamanho e são reaproveitadas com fig.clear(), evitando reconstruir
+        Figure/canvas a cada gráfico.
+        """
+        _configurar_estilo()
+        try:
+            fig = self._figuras_livres.setdefault(tuple(figsize), []).pop()
+            fig.clear()
+        except IndexError:
+            fig = Figure(figsize=figsize)
+            FigureCanvasAgg(fig)
+        # Margens padrão dos gráficos (ver _gravar_figura); os que diferem
+        # ajustam só o que muda
+        fig.subplots_adjust(**_MARGENS_PADRAO)
+        return fig, fig.subplots(nrows, ncols)
+
+    def _gravar_figura(self, fig: Figure, caminho: Path):
+        """
+        Renderiza e grava o PNG (libera o GIL durante o render e o zlib).
+        Sem bbox_inches='tight': as margens são fixadas na criação da figura
+        (ou por tight_layout nos gráficos 5 e 8), o que evita uma passada
+        extra de layout só para medir o recorte a cada savefig.
+        """
+        try:
+            fig.savefig(
+                caminho,
+                dpi=self.dpi,
+                facecolor='white',
+                edgecolor='none',
+                metadata={'Software': None},
+                pil_kwargs={'compress_level': self.compress_level, 'optimize': False}
+            )
+        finally:
+            # Só volta ao pool depois de gravada: no lote o savefig roda em
+            # outra thread e a figura não pode ser limpa antes disso. Fora do
+            # lote não há pool: cada figura guarda o buffer do renderer Agg
+            # (~30 MB em 12x7 a 300 dpi)
+            if self._executor is not None:
+                self._figuras_livres.setdefault(tuple(fig.get_size_inches()), []).append(fig)
+
+    def _save_figure(self, fig: Figure, nome: str):
         """Salva figura com configurações de alta qualidade"""
         caminho = self.output_dir / f"{nome}_{self.timestamp}.png"
-        fig.savefig(
-            caminho,
-            dpi=self.dpi,
-            bbox_inches='tight',
-            facecolor='white',
-            edgecolor='none'
-        )
-        plt.close(fig)
+        if self._executor is not None:
+            self._salvamentos[caminho] = self._executor.submit(self._gravar_figura, fig, caminho)
+            return caminho
+        self._gravar_figura(fig, caminho)
         print(f"✓ Gráfico salvo: {caminho}")
         return caminho
 
+    @staticmethod
+    def _para_array(valores) -> np.ndarray:
+        """
+        Converte valores de entrada para array contíguo float32, precisão
+        suficiente para renderizar e metade dos bytes de float64
+        """
+        return np.ascontiguousarray(valores, dtype=np.float32)
+
+    @staticmethod
+    def _grupos_com_dados(grupos: Dict[str, Valores]) -> Dict[str, Valores]:
+        """
+        Descarta grupos sem scores: o seaborn não reserva posição no eixo x
+        para eles, então pontos e médias sobrepostos precisam da mesma lista
+        """
+        return {chave: valores for chave, valores in grupos.items() if len(valores)}
+
+    @classmethod
+    def _empilhar_grupos(cls, grupos: Dict[str, Valores]) -> Tuple[np.ndarray, np.ndarray]:
+        """Achata {grupo: scores} em dois arrays paralelos (rótulos, scores)"""
+        chaves = list(grupos.keys())
+        arrays = [cls._para_array(grupos[k]) for k in chaves]
+        scores = np.concatenate(arrays) if arrays else np.empty(0, dtype=np.float32)
+        rotulos = np.repeat(chaves, [a.size for a in arrays])
+        return rotulos, scores
+
+    def _amostrar(self, n: int) -> Optional[np.ndarray]:
+        """Índices de uma amostra fixa quando há mais pontos que max_overlay_points"""
+        if n <= self.max_overlay_points:
+            return None
+        rng = np.random.default_rng(0)
+        return np.sort(rng.choice(n, size=self.max_overlay_points, replace=False))
+
+    def _sobrepor_pontos(self, ax, grupos: Dict[str, Valores], scores: np.ndarray):
+        """
+        Desenha os pontos individuais sobre as categorias com jitter
+        horizontal, num único scatter (equivale ao stripplot do seaborn)
+        """
+        rng = np.random.default_rng(0)
+        x = np.repeat(np.arange(len(grupos)), [len(v) for v in grupos.values()])
+        idx = self._amostrar(x.size)
+        if idx is not None:
+            x, scores = x[idx], scores[idx]
+        x = x + rng.uniform(-0.1, 0.1, size=x.size)
+        ax.scatter(x, scores, c='black', alpha=0.3, s=9, linewidths=0)
+
+    @_memoizar_render
     def grafico_1_distribuicao_scores_antes(
         self,
-        scores_por_genero: Dict[str, List[float]],
+        scores_por_genero: Dict[str, Valores],
         titulo: str = "Distribuição de Scores por Gênero (Antes da Correção)"
     ) -> Path:
         """
         Gráfico 1: Distribuição de scores por gênero antes da correção
         Violin plot mostrando distribuição completa
         """
-        fig, ax = plt.subplots(figsize=(12, 7))
+        fig, ax = self._nova_figura((12, 7))
+
+        import pandas as pd
+        import seaborn as sns
 
         # Prepara dados
-        data = []
-        for genero, scores in scores_por_genero.items():
-            for score in scores:
-                data.append({'Gênero': genero, 'Score': score})
-        df = pd.DataFrame(data)
+        scores_por_genero = self._grupos_com_dados(scores_por_genero)
+        rotulos, scores = self._empilhar_grupos(scores_por_genero)
+        df = pd.DataFrame({'Gênero': rotulos, 'Score': scores})
 
         # Violin plot
         sns.violinplot(data=df, x='Gênero', y='Score', ax=ax, inner='box')
 
         # Adiciona pontos individuais
-        sns.stripplot(data=df, x='Gênero', y='Score', ax=ax,
-                     color='black', alpha=0.3, size=3)
+        self._sobrepor_pontos(ax, scores_por_genero, scores)
 
-        # Adiciona médias
-        for i, (genero, scores) in enumerate(scores_por_genero.items()):
-            media = np.mean(scores)
+        # Adiciona médias (uma única passada de groupby, na ordem dos grupos)
+        medias = df.groupby('Gênero', sort=False)['Score'].mean().reindex(list(scores_por_genero))
+        for i, (genero, media) in enumerate(medias.items()):
             ax.hlines(media, i-0.3, i+0.3, colors='red',
                      linestyles='--', linewidth=2, label=f'Média {genero}' if i == 0 else '')
 
@@ -96,34 +310,35 @@ class GraphGenerator:
 
         return self._save_figure(fig, "01_distribuicao_antes")
 
+    @_memoizar_render
     def grafico_2_distribuicao_scores_depois(
         self,
-        scores_por_genero: Dict[str, List[float]],
+        scores_por_genero: Dict[str, Valores],
         titulo: str = "Distribuição de Scores por Gênero (Depois da Correção)"
     ) -> Path:
         """
         Gráfico 2: Distribuição de scores por gênero depois da correção
         """
-        fig, ax = plt.subplots(figsize=(12, 7))
+        fig, ax = self._nova_figura((12, 7))
+
+        import pandas as pd
+        import seaborn as sns
 
         # Prepara dados
-        data = []
-        for genero, scores in scores_por_genero.items():
-            for score in scores:
-                data.append({'Gênero': genero, 'Score': score})
-        df = pd.DataFrame(data)
+        scores_por_genero = self._grupos_com_dados(scores_por_genero)
+        rotulos, scores = self._empilhar_grupos(scores_por_genero)
+        df = pd.DataFrame({'Gênero': rotulos, 'Score': scores})
 
         # Violin plot
         sns.violinplot(data=df, x='Gênero', y='Score', ax=ax, inner='box',
                       palette='Set2')
 
         # Adiciona pontos individuais
-        sns.stripplot(data=df, x='Gênero', y='Score', ax=ax,
-                     color='black', alpha=0.3, size=3)
+        self._sobrepor_pontos(ax, scores_por_genero, scores)
 
-        # Adiciona médias
-        for i, (genero, scores) in enumerate(scores_por_genero.items()):
-            media = np.mean(scores)
+        # Adiciona médias (uma única passada de groupby, na ordem dos grupos)
+        medias = df.groupby('Gênero', sort=False)['Score'].mean().reindex(list(scores_por_genero))
+        for i, (genero, media) in enumerate(medias.items()):
             ax.hlines(media, i-0.3, i+0.3, colors='green',
                      linestyles='--', linewidth=2)
 
@@ -134,6 +349,7 @@ class GraphGenerator:
 
         return self._save_figure(fig, "02_distribuicao_depois")
 
+    @_memoizar_render
     def grafico_3_comparacao_medias(
         self,
         medias_antes: Dict[str, float],
@@ -143,7 +359,7 @@ class GraphGenerator:
         """
         Gráfico 3: Comparação de médias antes e depois da correção
         """
-        fig, ax = plt.subplots(figsize=(12, 7))
+        fig, ax = self._nova_figura((12, 7))
 
         generos = list(medias_antes.keys())
         x = np.arange(len(generos))
@@ -157,11 +373,7 @@ class GraphGenerator:
 
         # Adiciona valores nas barras
         for bars in [bars1, bars2]:
-            for bar in bars:
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{height:.2f}',
-                       ha='center', va='bottom', fontsize=10, fontweight='bold')
+            ax.bar_label(bars, fmt='%.2f', padding=3, fontsize=10, fontweight='bold')
 
         ax.set_title(titulo, fontsize=16, fontweight='bold', pad=20)
         ax.set_xlabel('Gênero', fontsize=12)
@@ -173,28 +385,34 @@ class GraphGenerator:
 
         return self._save_figure(fig, "03_comparacao_medias")
 
+    @_memoizar_render
     def grafico_4_boxplot_avaliacoes(
         self,
-        scores_por_tipo: Dict[str, List[float]],
+        scores_por_tipo: Dict[str, Valores],
         titulo: str = "Distribuição de Scores por Tipo de Avaliação"
     ) -> Path:
         """
         Gráfico 4: Boxplot de scores por tipo de avaliação
         """
-        fig, ax = plt.subplots(figsize=(14, 7))
+        fig, ax = self._nova_figura((14, 7))
+
+        import pandas as pd
+        import seaborn as sns
 
         # Prepara dados
-        data = []
-        for tipo, scores in scores_por_tipo.items():
-            for score in scores:
-                data.append({'Tipo': tipo, 'Score': score})
-        df = pd.DataFrame(data)
+        scores_por_tipo = self._grupos_com_dados(scores_por_tipo)
+        rotulos, scores = self._empilhar_grupos(scores_por_tipo)
+        df = pd.DataFrame({'Tipo': rotulos, 'Score': scores})
 
         # Boxplot
         sns.boxplot(data=df, x='Tipo', y='Score', ax=ax, palette='Set3')
 
         # Adiciona média como ponto vermelho
-        medias = df.groupby('Tipo')['Score'].mean()
+        contagens = [len(v) for v in scores_por_tipo.values()]
+        codigos = np.repeat(np.arange(len(contagens)), contagens)
+        somas = np.bincount(codigos, weights=scores, minlength=len(contagens))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            medias = somas / np.asarray(contagens)
         ax.scatter(range(len(medias)), medias, color='red', s=100,
                   zorder=3, label='Média', marker='D')
 
@@ -205,8 +423,12 @@ class GraphGenerator:
         ax.legend()
         ax.grid(True, alpha=0.3, axis='y')
 
+        # Rótulos do eixo x rotacionados precisam de mais margem inferior
+        fig.subplots_adjust(left=0.06, bottom=0.18)
+
         return self._save_figure(fig, "04_boxplot_avaliacoes")
 
+    @_memoizar_render
     def grafico_5_eficacia_correcao(
         self,
         diferenca_antes: float,
@@ -218,25 +440,22 @@ class GraphGenerator:
         """
         Gráfico 5: Gráfico de barras mostrando eficácia da correção
         """
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+        fig, (ax1, ax2) = self._nova_figura((14, 6), 1, 2)
 
         # Subgráfico 1: Diferença de médias
         categorias = ['Antes\nda Correção', 'Depois\nda Correção']
-        valores = [abs(diferenca_antes), abs(diferenca_depois)]
+        antes, depois = abs(diferenca_antes), abs(diferenca_depois)
+        valores = [antes, depois]
         cores = ['#E74C3C', '#27AE60']
 
         bars = ax1.bar(categorias, valores, color=cores, alpha=0.8, width=0.5)
 
         # Adiciona valores
-        for bar in bars:
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.3f}',
-                    ha='center', va='bottom', fontsize=12, fontweight='bold')
-
-        # Calcula redução percentual
-        reducao = ((abs(diferenca_antes) - abs(diferenca_depois)) / abs(diferenca_antes) * 100)
-        ax1.text(0.5, max(valores) * 0.5, f'Redução:\n{reducao:.1f}%',
+        ax1.bar_label(bars, fmt='%.3f', padding=3, fontsize=12, fontweight='bold')
+
+        # Calcula redução percentual (sem diferença inicial não há o que reduzir)
+        reducao = (antes - depois) / antes * 100 if antes > 0 else 0.0
+        ax1.text(0.5, max(antes, depois) * 0.5, f'Redução:\n{reducao:.1f}%',
                 ha='center', fontsize=14, fontweight='bold',
                 bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.5))
 
@@ -255,46 +474,42 @@ class GraphGenerator:
                    label='Nível de Significância (0.05)')
 
         # Adiciona valores
-        for bar in bars2:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.4f}',
-                    ha='center', va='bottom', fontsize=11, fontweight='bold')
+        ax2.bar_label(bars2, fmt='%.4f', padding=3, fontsize=11, fontweight='bold')
 
         ax2.set_title('Significância Estatística (p-value)', fontsize=13, fontweight='bold')
         ax2.set_ylabel('P-value', fontsize=11)
         ax2.legend()
         ax2.grid(True, alpha=0.3, axis='y')
 
-        fig.suptitle(titulo, fontsize=16, fontweight='bold', y=1.02)
-        plt.tight_layout()
+        fig.suptitle(titulo, fontsize=16, fontweight='bold', y=0.98)
+        fig.tight_layout(rect=(0, 0, 1, 0.96))
 
         return self._save_figure(fig, "05_eficacia_correcao")
 
+    @_memoizar_render
     def grafico_6_histograma_distribuicao(
         self,
-        scores: List[float],
+        scores: Valores,
         titulo: str = "Histograma de Distribuição de Scores",
         bins: int = 30
     ) -> Path:
         """
         Gráfico 6: Histograma da distribuição de scores
         """
-        fig, ax = plt.subplots(figsize=(12, 7))
+        fig, ax = self._nova_figura((12, 7))
+
+        # Ordena uma vez: mínimo, máximo e percentis saem por indexação
+        ordenados = np.sort(self._para_array(scores))
 
         # Histograma
-        n, bins_edges, patches = ax.hist(scores, bins=bins, alpha=0.7,
+        n, bins_edges, patches = ax.hist(ordenados, bins=bins, alpha=0.7,
                                          color='skyblue', edgecolor='black')
 
-        # Adiciona curva de densidade
-        mu = np.mean(scores)
-        sigma = np.std(scores)
-        x = np.linspace(min(scores), max(scores), 100)
+        # Estatísticas da curva e dos percentis
+        mu, sigma, (p25, p50, p75), x, densidade = _estatisticas_histograma(ordenados)
 
-        # Normaliza para escala do histograma
-        from scipy import stats
-        densidade = stats.norm.pdf(x, mu, sigma)
-        densidade_normalizada = densidade * len(scores) * (bins_edges[1] - bins_edges[0])
+        # Curva de densidade normal, normalizada para escala do histograma
+        densidade_normalizada = densidade * ordenados.size * (bins_edges[1] - bins_edges[0])
 
         ax.plot(x, densidade_normalizada, 'r-', linewidth=2,
                label=f'Distribuição Normal\n(μ={mu:.2f}, σ={sigma:.2f})')
@@ -304,7 +519,6 @@ class GraphGenerator:
                   label=f'Média: {mu:.2f}')
 
         # Linhas verticais nos percentis
-        p25, p50, p75 = np.percentile(scores, [25, 50, 75])
         ax.axvline(p25, color='orange', linestyle=':', linewidth=1.5,
                   label=f'P25: {p25:.2f}')
         ax.axvline(p50, color='green', linestyle=':', linewidth=1.5,
@@ -320,30 +534,45 @@ class GraphGenerator:
 
         return self._save_figure(fig, "06_histograma_distribuicao")
 
+    @_memoizar_render
     def grafico_7_scatter_desempenho_potencial(
         self,
-        desempenho: List[float],
-        potencial: List[float],
-        generos: Optional[List[str]] = None,
+        desempenho: Valores,
+        potencial: Valores,
+        generos: Optional[Union[Sequence[str], np.ndarray]] = None,
         titulo: str = "Desempenho vs Potencial"
     ) -> Path:
         """
         Gráfico 7: Scatter plot de desempenho vs potencial
         """
-        fig, ax = plt.subplots(figsize=(12, 10))
+        fig, ax = self._nova_figura((12, 10))
+
+        tem_genero = generos is not None and len(generos) > 0
+
+        desempenho = self._para_array(desempenho)
+        potencial = self._para_array(potencial)
+        if tem_genero:
+            generos = np.asarray(generos)
+
+        # Com muitos pontos, desenha só uma amostra fixa
+        idx = self._amostrar(desempenho.size)
+        if idx is not None:
+            desempenho, potencial = desempenho[idx], potencial[idx]
+            if tem_genero:
+                generos = generos[idx]
 
         # Se temos informação de gênero, colorir por gênero
-        if generos:
-            df = pd.DataFrame({
-                'Desempenho': desempenho,
-                'Potencial': potencial,
-                'Gênero': generos
-            })
-
-            for genero in df['Gênero'].unique():
-                mask = df['Gênero'] == genero
-                ax.scatter(df[mask]['Desempenho'], df[mask]['Potencial'],
-                          label=genero, alpha=0.6, s=100, edgecolors='black')
+        if tem_genero:
+            # Códigos inteiros por gênero, na ordem de primeira ocorrência
+            # (sem ordenar: aceita enums Genero e gêneros ausentes)
+            valores = generos.tolist()
+            unicos = list(dict.fromkeys(valores))
+            posicoes = {genero: i for i, genero in enumerate(unicos)}
+            codigos = np.fromiter((posicoes[g] for g in valores), dtype=np.intp, count=len(valores))
+            for i, genero in enumerate(unicos):
+                mask = codigos == i
+                ax.scatter(desempenho[mask], potencial[mask],
+                          label=str(genero), alpha=0.6, s=100, edgecolors='black')
         else:
             ax.scatter(desempenho, potencial, alpha=0.6, s=100,
                       edgecolors='black', c='blue')
@@ -377,13 +606,17 @@ class GraphGenerator:
         ax.set_xlim(0, 10)
         ax.set_ylim(0, 10)
 
-        if generos:
+        if tem_genero:
             ax.legend(title='Gênero', fontsize=11)
 
         ax.grid(True, alpha=0.3)
 
+        # Figura mais alta: margens verticais proporcionalmente menores
+        fig.subplots_adjust(top=0.92, bottom=0.07)
+
         return self._save_figure(fig, "07_scatter_desempenho_potencial")
 
+    @_memoizar_render
     def grafico_8_comparativo_cenarios(
         self,
         cenarios_data: Dict[str, Dict[str, float]],
@@ -399,7 +632,7 @@ class GraphGenerator:
                     'Cenário 2': {'Métrica 1': valor, 'Métrica 2': valor, ...},
                 }
         """
-        fig, ax = plt.subplots(figsize=(14, 8))
+        fig, ax = self._nova_figura((14, 8))
 
         # Prepara dados
         cenarios = list(cenarios_data.keys())
@@ -409,7 +642,7 @@ class GraphGenerator:
         width = 0.8 / len(cenarios)
 
         # Cores para cada cenário
-        cores = plt.cm.Set3(np.linspace(0, 1, len(cenarios)))
+        cores = _cores_set3(len(cenarios))
 
         # Desenha barras para cada cenário
         for i, (cenario, cor) in enumerate(zip(cenarios, cores)):
@@ -419,11 +652,7 @@ class GraphGenerator:
                          color=cor, alpha=0.8, edgecolor='black')
 
             # Adiciona valores nas barras
-            for bar in bars:
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{height:.2f}',
-                       ha='center', va='bottom', fontsize=8, rotation=0)
+            ax.bar_label(bars, fmt='%.2f', padding=3, fontsize=8)
 
         ax.set_title(titulo, fontsize=16, fontweight='bold', pad=20)
         ax.set_xlabel('Métricas', fontsize=12)
@@ -433,7 +662,7 @@ class GraphGenerator:
         ax.legend(title='Cenários', fontsize=10)
         ax.grid(True, alpha=0.3, axis='y')
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         return self._save_figure(fig, "08_comparativo_cenarios")
 
@@ -466,89 +695,41 @@ class GraphGenerator:
 
         Returns:
             Lista com caminhos de todos os gráficos gerados
+
+        As séries (List[float]/List[str]) também podem ser arrays numpy.
         """
         graficos = []
 
         print("\n=== Gerando 8 Gráficos Essenciais ===\n")
 
-        try:
-            # Gráfico 1
-            if 'scores_antes_por_genero' in dados_completos:
-                graficos.append(self.grafico_1_distribuicao_scores_antes(
-                    dados_completos['scores_antes_por_genero']
-                ))
-        except Exception as e:
-            print(f"⚠ Erro no Gráfico 1: {e}")
-
-        try:
-            # Gráfico 2
-            if 'scores_depois_por_genero' in dados_completos:
-                graficos.append(self.grafico_2_distribuicao_scores_depois(
-                    dados_completos['scores_depois_por_genero']
-                ))
-        except Exception as e:
-            print(f"⚠ Erro no Gráfico 2: {e}")
-
-        try:
-            # Gráfico 3
-            if 'medias_antes' in dados_completos and 'medias_depois' in dados_completos:
-                graficos.append(self.grafico_3_comparacao_medias(
-                    dados_completos['medias_antes'],
-                    dados_completos['medias_depois']
-                ))
-        except Exception as e:
-            print(f"⚠ Erro no Gráfico 3: {e}")
-
-        try:
-            # Gráfico 4
-            if 'scores_por_tipo' in dados_completos:
-                graficos.append(self.grafico_4_boxplot_avaliacoes(
-                    dados_completos['scores_por_tipo']
-                ))
-        except Exception as e:
-            print(f"⚠ Erro no Gráfico 4: {e}")
-
-        try:
-            # Gráfico 5
-            if all(k in dados_completos for k in ['diferenca_antes', 'diferenca_depois',
-                                                   'p_value_antes', 'p_value_depois']):
-                graficos.append(self.grafico_5_eficacia_correcao(
-                    dados_completos['diferenca_antes'],
-                    dados_completos['diferenca_depois'],
-                    dados_completos['p_value_antes'],
-                    dados_completos['p_value_depois']
-                ))
-        except Exception as e:
-            print(f"⚠ Erro no Gráfico 5: {e}")
-
-        try:
-            # Gráfico 6
-            if 'todos_scores' in dados_completos:
-                graficos.append(self.grafico_6_histograma_distribuicao(
-                    dados_completos['todos_scores']
-                ))
-        except Exception as e:
-            print(f"⚠ Erro no Gráfico 6: {e}")
-
-        try:
-            # Gráfico 7
-            if 'desempenho' in dados_completos and 'potencial' in dados_completos:
-                graficos.append(self.grafico_7_scatter_desempenho_potencial(
-                    dados_completos['desempenho'],
-                    dados_completos['potencial'],
-                    dados_completos.get('generos')
-                ))
-        except Exception as e:
-            print(f"⚠ Erro no Gráfico 7: {e}")
-
-        try:
-            # Gráfico 8
-            if 'cenarios' in dados_completos:
-                graficos.append(self.grafico_8_comparativo_cenarios(
-                    dados_completos['cenarios']
-                ))
-        except Exception as e:
-            print(f"⚠ Erro no Gráfico 8: {e}")
+        self._executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+        self._salvamentos = {}
+        for numero, (metodo, obrigatorias, opcionais) in enumerate(self.GRAFICOS, start=1):
+            if not all(k in dados_completos for k in obrigatorias):
+                continue
+            try:
+                args = [dados_completos[k] for k in obrigatorias]
+                args += [dados_completos.get(k) for k in opcionais]
+                graficos.append(getattr(self, metodo)(*args))
+            except Exception as e:
+                print(f"⚠ Erro no Gráfico {numero}: {e}")
+
+        # Aguarda a gravação dos PNGs enfileirados
+        self._executor.shutdown(wait=True)
+        self._executor = None
+        for caminho, futuro in self._salvamentos.items():
+            try:
+                futuro.result()
+                print(f"✓ Gráfico salvo: {caminho}")
+            except Exception as e:
+                graficos.remove(caminho)
+                self._render_cache = {
+                    k: v for k, v in self._render_cache.items() if v != caminho
+                }
+                print(f"⚠ Erro ao salvar {caminho.name}: {e}")
+        self._salvamentos = {}
+        # Libera as figuras do pool (e os buffers de render que elas retêm)
+        self._figuras_livres = {}
 
         print(f"\n✓ Total de gráficos gerados: {len(graficos)}/8")
 
@@ -3,15 +3,111 @@ Gerador de Apresentações PowerPoint Automatizadas
 Cria apresentações profissionais com gráficos e tabelas
 """
 
+import copy
+import itertools
+import logging
+from functools import lru_cache
+
 from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.opc.packuri import PackURI
+from pptx.parts.image import Image, ImagePart
+from pptx.util import Inches
 from pptx.dml.color import RGBColor
+from io import BytesIO
+from PIL import Image as PILImage
+from xml.sax.saxutils import escape
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
+# Medidas fixas (polegadas) convertidas para EMU uma única vez
+_IN_0_8 = Inches(0.8)
+_IN_1 = Inches(1)
+_IN_1_5 = Inches(1.5)
+_IN_2 = Inches(2)
+_IN_4 = Inches(4)
+_IN_5_8 = Inches(5.8)
+_IN_7_5 = Inches(7.5)
+_IN_8 = Inches(8)
+_IN_10 = Inches(10)
+
+# Propriedades de parágrafo das células de tabela (centralizado; cabeçalho 11pt
+# negrito branco, dados 10pt), clonadas em cada célula em vez de atribuir
+# tamanho/negrito/cor/alinhamento propriedade a propriedade
+_PPR_CABECALHO = parse_xml(
+    f'<a:pPr {nsdecls("a")} algn="ctr"><a:defRPr sz="1100" b="1">'
+    '<a:solidFill><a:srgbClr val="FFFFFF"/></a:solidFill></a:defRPr></a:pPr>'
+)
+_PPR_DADOS = parse_xml(f'<a:pPr {nsdecls("a")} algn="ctr"><a:defRPr sz="1000"/></a:pPr>')
+
+
+@lru_cache(maxsize=None)
+def _ppr_texto(tamanho: int, negrito: bool = False, cor: Optional[str] = None):
+    """
+    Propriedades de parágrafo (para clonar) dos títulos e textos dos slides:
+    fonte de `tamanho` pt, negrito e cor hex opcionais. Montadas uma vez por
+    combinação, inclusive se as cores do gerador forem trocadas.
+    """
+    atributos = f' sz="{tamanho * 100}"' + (' b="1"' if negrito else '')
+    preenchimento = f'<a:solidFill><a:srgbClr val="{cor}"/></a:solidFill>' if cor else ''
+    return parse_xml(
+        f'<a:pPr {nsdecls("a")}><a:defRPr{atributos}>{preenchimento}</a:defRPr></a:pPr>'
+    )
+
+
+# Propriedades dos parágrafos das listas de bullet points (18pt, 10pt antes)
+_PPR_BULLET = '<a:pPr><a:spcBef><a:spcPts val="1000"/></a:spcBef><a:defRPr sz="1800"/></a:pPr>'
+# Caixa de texto (equivalente ao add_textbox com word_wrap) com os parágrafos
+_SP_CAIXA_TEXTO = (
+    '<p:sp {nsdecls}><p:nvSpPr><p:cNvPr id="{id}" name="{nome}"/><p:cNvSpPr txBox="1"/>'
+    '<p:nvPr/></p:nvSpPr><p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/>'
+    '</a:xfrm><a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="square"><a:spAutoFit/></a:bodyPr><a:lstStyle/>{paragrafos}'
+    '</p:txBody></p:sp>'
+)
+# Preenchimento cinza (F2F2F2) das linhas pares de dados (zebra)
+_FILL_ZEBRA = parse_xml(
+    f'<a:solidFill {nsdecls("a")}><a:srgbClr val="F2F2F2"/></a:solidFill>'
+)
+
+
+# Conteúdo fixo da apresentação, montado uma única vez
+_PONTOS_METODOLOGIA = (
+    "Framework de detecção e correção de viés de gênero",
+    "Análise estatística com testes t de Student",
+    "Nível de significância: α = 0.05",
+    "Correção por reponderação de scores",
+    "Avaliação de eficácia da correção"
+)
+
+# Gráficos adicionais: (título do slide, índice em graficos)
+_GRAFICOS_EXTRAS = (
+    ("Eficácia da Correção", 4),
+    ("Distribuição Geral", 5),
+    ("Desempenho vs Potencial", 6)
+)
+
+_CONCLUSOES = (
+    "Viés de gênero foi detectado nos dados originais",
+    "A correção por reponderação mostrou-se eficaz",
+    "Redução significativa na diferença de médias entre gêneros",
+    "P-values indicam melhoria na equidade estatística",
+    "Mudanças no ranking refletem correção aplicada"
+)
+
+_RECOMENDACOES = (
+    "Implementar correção de viés como prática padrão",
+    "Monitorar métricas de equidade periodicamente",
+    "Treinar avaliadores sobre vieses inconscientes",
+    "Revisar processos de avaliação regularmente",
+    "Documentar decisões e justificativas"
+)
+
 
 class PowerPointGenerator:
     """
@@ -24,53 +120,130 @@ class PowerPointGenerator:
     - Total: 15-20 slides
     """
 
-    def __init__(self, output_dir: str = "reports/powerpoint"):
+    def __init__(self, output_dir: str = "reports/powerpoint", dpi_imagens: Optional[int] = None):
         """
         Inicializa o gerador de PowerPoint.
 
         Args:
             output_dir: Diretório para salvar as apresentações
+            dpi_imagens: Resolução máxima dos gráficos na largura em que
+                aparecem no slide; PNGs maiores são reduzidos antes de
+                embutir (None mantém o arquivo original)
         """
         self.output_dir = Path(output_dir)
+        self.dpi_imagens = dpi_imagens
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        agora = datetime.now()
+        self.timestamp = agora.strftime("%Y%m%d_%H%M%S")
+        self.data_br = agora.strftime('%d/%m/%Y')  # Data exibida na capa
 
         # Cores corporativas
         self.cor_primaria = RGBColor(54, 96, 146)  # Azul escuro
         self.cor_secundaria = RGBColor(79, 129, 189)  # Azul claro
         self.cor_destaque = RGBColor(192, 0, 0)  # Vermelho
         self.cor_sucesso = RGBColor(0, 176, 80)  # Verde
+        self.cor_branca = RGBColor(255, 255, 255)  # Títulos de seção
+        self.cor_cinza = RGBColor(100, 100, 100)  # Observações
+
+        # Layouts da apresentação em uso (título, conteúdo, seção) e os
+        # placeholders já clonados de cada um, usados como molde
+        self._layouts_prs = None
+        self._layouts = None
+        self._moldes: Dict[int, List] = {}
+
+        # Conteúdo dos PNGs já lidos (e reduzidos, se for o caso) na
+        # apresentação em montagem, por arquivo e largura no slide
+        self._png_bytes: Dict[Tuple[Path, float], bytes] = {}
+
+    def _layout(self, prs: Presentation, indice: int):
+        """
+        Retorna o layout do slide, buscando os três layouts usados uma única
+        vez por apresentação (prs.slide_layouts percorre o XML a cada acesso)
+        """
+        if self._layouts_prs is not prs:
+            layouts = prs.slide_layouts
+            self._layouts = {i: layouts[i] for i in (0, 1, 2)}
+            self._moldes = {}
+            self._layouts_prs = prs
+        return self._layouts[indice]
+
+    def _novo_slide(self, prs: Presentation, indice: int):
+        """
+        Adiciona um slide com o layout indicado. O primeiro slide de cada
+        layout passa pelo add_slide do python-pptx, que clona os placeholders
+        do layout um a um; os seguintes recebem cópias do XML desses
+        placeholders recém-criados, guardado como molde
+        """
+        slide_layout = self._layout(prs, indice)
+        molde = self._moldes.get(indice)
+        if molde is None:
+            slide = prs.slides.add_slide(slide_layout)
+            self._moldes[indice] = [
+                copy.deepcopy(elemento) for elemento in slide.shapes._spTree.iter_shape_elms()
+            ]
+            return slide
+
+        rId, slide = prs.part.add_slide(slide_layout)
+        sp_tree = slide.shapes._spTree
+        for elemento in molde:
+            sp_tree.append(copy.deepcopy(elemento))
+        prs.slides._sldIdLst.add_sldId(rId)
+        return slide
+
+    @staticmethod
+    def _preparar_pacote(prs: Presentation):
+        """
+        Evita as varreduras do pacote a cada add_picture. O python-pptx percorre
+        o grafo inteiro de relacionamentos tanto para achar o próximo
+        /ppt/media/imageN quanto para procurar uma imagem igual já embutida, o
+        que deixa a montagem quadrática no número de slides. Aqui a numeração
+        vira um contador e as imagens ficam num índice por SHA-1 do conteúdo,
+        de modo que o mesmo PNG em vários slides é embutido uma única vez.
+        Os slides já são numerados em O(1) pelo próprio python-pptx.
+        """
+        pacote = prs.part.package
+
+        # Uma única varredura: maior índice de imagem já usado e as imagens
+        # que o template já traz, indexadas pelo mesmo SHA-1 do python-pptx
+        existentes = []
+        partes_imagem: Dict[str, ImagePart] = {}
+        for parte in pacote.iter_parts():
+            if parte.partname.startswith('/ppt/media/image') and parte.partname.idx is not None:
+                existentes.append(parte.partname.idx)
+            if isinstance(parte, ImagePart):
+                partes_imagem.setdefault(parte.sha1, parte)
+        contador = itertools.count(max(existentes, default=0) + 1)
+        pacote.next_image_partname = lambda ext: PackURI(f"/ppt/media/image{next(contador)}.{ext}")
+
+        def get_or_add_image_part(image_file):
+            image = Image.from_file(image_file)
+            parte = partes_imagem.get(image.sha1)
+            if parte is None:
+                parte = partes_imagem[image.sha1] = ImagePart.new(pacote, image)
+            return parte
+
+        pacote.get_or_add_image_part = get_or_add_image_part
 
     def _adicionar_slide_titulo(self, prs: Presentation, titulo: str, subtitulo: str = ""):
         """Adiciona slide de título"""
-        slide_layout = prs.slide_layouts[0]  # Layout de título
-        slide = prs.slides.add_slide(slide_layout)
-
-        title = slide.shapes.title
-        subtitle = slide.placeholders[1]
+        slide = self._novo_slide(prs, 0)  # Layout de título
 
-        title.text = titulo
-        title.text_frame.paragraphs[0].font.size = Pt(44)
-        title.text_frame.paragraphs[0].font.bold = True
-        title.text_frame.paragraphs[0].font.color.rgb = self.cor_primaria
+        self._escrever_texto(
+            slide.shapes.title, titulo, _ppr_texto(44, True, str(self.cor_primaria))
+        )
 
         if subtitulo:
-            subtitle.text = subtitulo
-            subtitle.text_frame.paragraphs[0].font.size = Pt(28)
-            subtitle.text_frame.paragraphs[0].font.color.rgb = self.cor_secundaria
+            self._escrever_texto(
+                slide.placeholders[1], subtitulo, _ppr_texto(28, cor=str(self.cor_secundaria))
+            )
 
         return slide
 
     def _adicionar_slide_secao(self, prs: Presentation, titulo: str):
         """Adiciona slide de seção"""
-        slide_layout = prs.slide_layouts[2]  # Layout de seção
-        slide = prs.slides.add_slide(slide_layout)
+        slide = self._novo_slide(prs, 2)  # Layout de seção
 
-        title = slide.shapes.title
-        title.text = titulo
-        title.text_frame.paragraphs[0].font.size = Pt(40)
-        title.text_frame.paragraphs[0].font.bold = True
-        title.text_frame.paragraphs[0].font.color.rgb = RGBColor(255, 255, 255)
+        self._escrever_texto(slide.shapes.title, titulo, _ppr_texto(40, True, str(self.cor_branca)))
 
         # Fundo colorido
         background = slide.background
@@ -87,19 +260,14 @@ class PowerPointGenerator:
         conteudo: Optional[str] = None
     ):
         """Adiciona slide de conteúdo"""
-        slide_layout = prs.slide_layouts[1]  # Layout de título e conteúdo
-        slide = prs.slides.add_slide(slide_layout)
+        slide = self._novo_slide(prs, 1)  # Layout de título e conteúdo
 
-        title = slide.shapes.title
-        title.text = titulo
-        title.text_frame.paragraphs[0].font.size = Pt(32)
-        title.text_frame.paragraphs[0].font.bold = True
-        title.text_frame.paragraphs[0].font.color.rgb = self.cor_primaria
+        self._escrever_texto(
+            slide.shapes.title, titulo, _ppr_texto(32, True, str(self.cor_primaria))
+        )
 
         if conteudo:
-            body = slide.placeholders[1]
-            body.text = conteudo
-            body.text_frame.paragraphs[0].font.size = Pt(18)
+            self._escrever_texto(slide.placeholders[1], conteudo, _ppr_texto(18))
 
         return slide
 
@@ -112,15 +280,45 @@ class PowerPointGenerator:
         width: float = 7.0
     ):
         """Adiciona imagem ao slide"""
-        if caminho_imagem.exists():
-            slide.shapes.add_picture(
-                str(caminho_imagem),
-                Inches(left),
-                Inches(top),
-                width=Inches(width)
-            )
-        else:
-            print(f"⚠ Imagem não encontrada: {caminho_imagem}")
+        # Cada arquivo é lido uma única vez por apresentação; a ausência é
+        # detectada pela própria abertura, sem um stat antes
+        chave = (caminho_imagem, width)
+        conteudo = self._png_bytes.get(chave)
+        if conteudo is None:
+            try:
+                conteudo = caminho_imagem.read_bytes()
+            except FileNotFoundError:
+                logger.warning("⚠ Imagem não encontrada: %s", caminho_imagem)
+                return
+            if self.dpi_imagens is not None:
+                conteudo = self._reduzir_resolucao(conteudo, width)
+            self._png_bytes[chave] = conteudo
+
+        imagem = slide.shapes.add_picture(
+            BytesIO(conteudo),
+            Inches(left),
+            Inches(top),
+            width=Inches(width)
+        )
+        # Vindo de um buffer, o texto alternativo seria "image.png"
+        imagem._element.nvPicPr.cNvPr.set('descr', caminho_imagem.name)
+
+    def _reduzir_resolucao(self, conteudo: bytes, largura: float) -> bytes:
+        """
+        Reduz o PNG para dpi_imagens na largura (polegadas) em que será
+        exibido. Continua PNG: gráficos têm linhas e texto finos, que o JPEG
+        borraria. Imagens já pequenas o bastante voltam intactas.
+        """
+        largura_px = round(largura * self.dpi_imagens)
+        with PILImage.open(BytesIO(conteudo)) as imagem:
+            if imagem.width <= largura_px:
+                return conteudo
+            altura_px = max(1, round(imagem.height * largura_px / imagem.width))
+            reduzida = imagem.resize((largura_px, altura_px), PILImage.LANCZOS)
+
+        saida = BytesIO()
+        reduzida.save(saida, format='PNG')
+        return saida.getvalue()
 
     def _adicionar_tabela(
         self,
@@ -132,8 +330,11 @@ class PowerPointGenerator:
         height: float = 3.0
     ):
         """Adiciona tabela ao slide"""
-        rows, cols = df.shape
-        rows += 1  # Header
+        # Cabeçalho e dados extraídos uma única vez; dtype=object preserva
+        # inteiros em tabelas mistas (sem o upcast para float do to_numpy)
+        colunas = df.columns.to_numpy()
+        valores = df.to_numpy(dtype=object)
+        rows, cols = valores.shape[0] + 1, valores.shape[1]  # +1: header
 
         # Cria tabela
         table = slide.shapes.add_table(
@@ -143,62 +344,73 @@ class PowerPointGenerator:
         ).table
 
         # Preenche header
-        for col_idx, col_name in enumerate(df.columns):
+        for col_idx, col_name in enumerate(colunas):
             cell = table.cell(0, col_idx)
-            cell.text = str(col_name)
+            self._escrever_texto(cell, str(col_name), _PPR_CABECALHO)
             cell.fill.solid()
             cell.fill.fore_color.rgb = self.cor_primaria
-            cell.text_frame.paragraphs[0].font.size = Pt(11)
-            cell.text_frame.paragraphs[0].font.bold = True
-            cell.text_frame.paragraphs[0].font.color.rgb = RGBColor(255, 255, 255)
-            cell.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
 
-        # Preenche dados
-        for row_idx, row in df.iterrows():
+        # Preenche dados (posição da linha, não o rótulo do índice)
+        for row_idx, row in enumerate(valores):
             for col_idx, value in enumerate(row):
                 cell = table.cell(row_idx + 1, col_idx)
-                cell.text = str(value)
-                cell.text_frame.paragraphs[0].font.size = Pt(10)
-                cell.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+                self._escrever_texto(cell, str(value), _PPR_DADOS)
 
                 # Zebra striping
                 if row_idx % 2 == 0:
-                    cell.fill.solid()
-                    cell.fill.fore_color.rgb = RGBColor(242, 242, 242)
+                    cell._tc.get_or_add_tcPr().append(copy.deepcopy(_FILL_ZEBRA))
+
+    @staticmethod
+    def _escrever_texto(alvo, texto: str, ppr):
+        """
+        Escreve o texto na forma ou célula e aplica ao primeiro parágrafo as
+        propriedades prontas (clonadas), no lugar dos setters de fonte um a um
+        """
+        alvo.text = texto
+        p = alvo.text_frame.paragraphs[0]._p
+        if p.pPr is not None:
+            p.remove(p.pPr)
+        p.insert(0, copy.deepcopy(ppr))
 
     def _adicionar_bullet_points(
         self,
         slide,
         titulo: str,
-        pontos: List[str]
+        pontos: Sequence[str],
+        skip_title: bool = False
     ):
-        """Adiciona slide com bullet points"""
-        title = slide.shapes.title
-        title.text = titulo
-        title.text_frame.paragraphs[0].font.size = Pt(32)
-        title.text_frame.paragraphs[0].font.bold = True
-        title.text_frame.paragraphs[0].font.color.rgb = self.cor_primaria
-
-        # Adiciona caixa de texto para bullets
-        left = Inches(1.5)
-        top = Inches(2.0)
-        width = Inches(7.5)
-        height = Inches(4.0)
-
-        textbox = slide.shapes.add_textbox(left, top, width, height)
-        text_frame = textbox.text_frame
-        text_frame.word_wrap = True
-
-        for i, ponto in enumerate(pontos):
-            if i == 0:
-                p = text_frame.paragraphs[0]
-            else:
-                p = text_frame.add_paragraph()
-
-            p.text = ponto
-            p.level = 0
-            p.font.size = Pt(18)
-            p.space_before = Pt(10)
+        """
+        Adiciona slide com bullet points
+
+        Args:
+            skip_title: Não reescreve o título (já formatado por
+                _adicionar_slide_conteudo)
+        """
+        if not skip_title:
+            self._escrever_texto(
+                slide.shapes.title, titulo, _ppr_texto(32, True, str(self.cor_primaria))
+            )
+
+        # Caixa de texto com um parágrafo por bullet (18pt, 10pt antes)
+        self._adicionar_caixa_texto(slide, _IN_1_5, _IN_2, _IN_7_5, _IN_4, pontos, _PPR_BULLET)
+
+    @staticmethod
+    def _adicionar_caixa_texto(slide, left, top, width, height, textos: Sequence[str], ppr: str):
+        """
+        Adiciona caixa de texto (com quebra de linha) montando o <p:sp> inteiro,
+        um parágrafo por texto com as propriedades ppr, num único parse de XML,
+        no lugar do add_textbox + add_paragraph + formatação item a item
+        """
+        shapes = slide.shapes
+        id_forma = shapes._next_shape_id
+        paragrafos = ''.join(
+            f'<a:p>{ppr}<a:r><a:t>{escape(texto)}</a:t></a:r></a:p>' for texto in textos
+        ) or '<a:p/>'
+        forma = parse_xml(_SP_CAIXA_TEXTO.format(
+            nsdecls=nsdecls('p', 'a'), id=id_forma, nome=f"TextBox {id_forma - 1}",
+            x=left, y=top, cx=width, cy=height, paragrafos=paragrafos
+        ))
+        shapes._spTree.insert_element_before(forma, 'p:extLst')
 
     def slide_capa(
         self,
@@ -208,10 +420,10 @@ class PowerPointGenerator:
     ):
         """Slide 1: Capa"""
         if subtitulo is None:
-            subtitulo = f"Relatório Gerado em {datetime.now().strftime('%d/%m/%Y')}"
+            subtitulo = f"Relatório Gerado em {self.data_br}"
 
         self._adicionar_slide_titulo(prs, titulo, subtitulo)
-        print("✓ Slide 1: Capa")
+        logger.info("✓ Slide 1: Capa")
 
     def slide_agenda(self, prs: Presentation, num_cenarios: int = 7):
         """Slide 2: Agenda"""
@@ -224,23 +436,15 @@ class PowerPointGenerator:
             "4. Conclusões e Recomendações"
         ]
 
-        self._adicionar_bullet_points(slide, "Agenda", pontos)
-        print("✓ Slide 2: Agenda")
+        self._adicionar_bullet_points(slide, "Agenda", pontos, skip_title=True)
+        logger.info("✓ Slide 2: Agenda")
 
     def slide_metodologia(self, prs: Presentation):
         """Slide 3: Metodologia"""
         slide = self._adicionar_slide_conteudo(prs, "Metodologia")
 
-        pontos = [
-            "Framework de detecção e correção de viés de gênero",
-            "Análise estatística com testes t de Student",
-            "Nível de significância: α = 0.05",
-            "Correção por reponderação de scores",
-            "Avaliação de eficácia da correção"
-        ]
-
-        self._adicionar_bullet_points(slide, "Metodologia", pontos)
-        print("✓ Slide 3: Metodologia")
+        self._adicionar_bullet_points(slide, "Metodologia", _PONTOS_METODOLOGIA, skip_title=True)
+        logger.info("✓ Slide 3: Metodologia")
 
     def slide_cenario_titulo(
         self,
@@ -255,7 +459,7 @@ class PowerPointGenerator:
         # Adiciona slide com descrição
         slide = self._adicionar_slide_conteudo(prs, titulo, descricao)
 
-        print(f"✓ Slide: Cenário {numero} - {titulo}")
+        logger.info("✓ Slide: Cenário %s - %s", numero, titulo)
 
     def slide_grafico(
         self,
@@ -272,22 +476,13 @@ class PowerPointGenerator:
 
         # Adiciona observações se houver
         if observacoes:
-            left = Inches(1.0)
-            top = Inches(5.8)
-            width = Inches(8.0)
-            height = Inches(0.8)
-
-            textbox = slide.shapes.add_textbox(left, top, width, height)
-            text_frame = textbox.text_frame
-            text_frame.word_wrap = True
-
-            p = text_frame.paragraphs[0]
-            p.text = observacoes
-            p.font.size = Pt(12)
-            p.font.italic = True
-            p.font.color.rgb = RGBColor(100, 100, 100)
+            ppr = (
+                '<a:pPr><a:defRPr sz="1200" i="1"><a:solidFill>'
+                f'<a:srgbClr val="{self.cor_cinza}"/></a:solidFill></a:defRPr></a:pPr>'
+            )
+            self._adicionar_caixa_texto(slide, _IN_1, _IN_5_8, _IN_8, _IN_0_8, [observacoes], ppr)
 
-        print(f"✓ Slide: {titulo}")
+        logger.info("✓ Slide: %s", titulo)
 
     def slide_tabela_resultados(
         self,
@@ -301,7 +496,7 @@ class PowerPointGenerator:
         # Adiciona tabela
         self._adicionar_tabela(slide, df, left=1.0, top=2.0, width=8.0, height=3.5)
 
-        print(f"✓ Slide: {titulo}")
+        logger.info("✓ Slide: %s", titulo)
 
     def slide_comparativo(
         self,
@@ -317,31 +512,31 @@ class PowerPointGenerator:
 
         self._adicionar_tabela(slide, df, left=1.0, top=2.5, width=8.0, height=2.0)
 
-        print(f"✓ Slide: {titulo}")
+        logger.info("✓ Slide: %s", titulo)
 
     def slide_conclusoes(
         self,
         prs: Presentation,
-        conclusoes: List[str]
+        conclusoes: Sequence[str]
     ):
         """Slide de conclusões"""
         slide = self._adicionar_slide_conteudo(prs, "Conclusões")
 
-        self._adicionar_bullet_points(slide, "Conclusões", conclusoes)
+        self._adicionar_bullet_points(slide, "Conclusões", conclusoes, skip_title=True)
 
-        print("✓ Slide: Conclusões")
+        logger.info("✓ Slide: Conclusões")
 
     def slide_recomendacoes(
         self,
         prs: Presentation,
-        recomendacoes: List[str]
+        recomendacoes: Sequence[str]
     ):
         """Slide de recomendações"""
         slide = self._adicionar_slide_conteudo(prs, "Recomendações")
 
-        self._adicionar_bullet_points(slide, "Recomendações", recomendacoes)
+        self._adicionar_bullet_points(slide, "Recomendações", recomendacoes, skip_title=True)
 
-        print("✓ Slide: Recomendações")
+        logger.info("✓ Slide: Recomendações")
 
     def slide_final(self, prs: Presentation):
         """Slide final"""
@@ -351,7 +546,7 @@ class PowerPointGenerator:
             "Framework de Redução de Viés em Avaliações de RH"
         )
 
-        print("✓ Slide: Final")
+        logger.info("✓ Slide: Final")
 
     def gerar_apresentacao_completa(
         self,
@@ -382,12 +577,14 @@ class PowerPointGenerator:
 
         caminho = self.output_dir / nome_arquivo
 
-        print("\n=== Gerando Apresentação PowerPoint ===\n")
+        logger.info("\n=== Gerando Apresentação PowerPoint ===\n")
 
         # Cria apresentação
         prs = Presentation()
-        prs.slide_width = Inches(10)
-        prs.slide_height = Inches(7.5)
+        prs.slide_width = _IN_10
+        prs.slide_height = _IN_7_5
+        self._preparar_pacote(prs)
+        self._png_bytes = {}
 
         # Slide 1: Capa
         self.slide_capa(prs)
@@ -400,9 +597,13 @@ class PowerPointGenerator:
 
         # Itera pelos cenários dinamicamente
         idx_grafico = 0
-        for key in sorted(dados_cenarios.keys()):
-            # Extrai número do cenário
-            num_cenario = int(key.split('_')[-1]) if '_' in key else 0
+        # Extrai o número de cada cenário uma única vez e ordena numericamente
+        # (cenario_10 depois de cenario_2)
+        cenarios_ordenados = sorted(
+            (int(key.rsplit('_', 1)[-1]) if '_' in key else 0, key)
+            for key in dados_cenarios
+        )
+        for num_cenario, key in cenarios_ordenados:
             dados = dados_cenarios[key]
 
             # Slide de título do cenário
@@ -445,43 +646,34 @@ class PowerPointGenerator:
             )
 
         # Gráficos adicionais
-        graficos_extras = [
-            ("Eficácia da Correção", 4),
-            ("Distribuição Geral", 5),
-            ("Desempenho vs Potencial", 6)
-        ]
-
-        for titulo, idx in graficos_extras:
+        for titulo, idx in _GRAFICOS_EXTRAS:
             if len(graficos) > idx:
                 self.slide_grafico(prs, titulo, graficos[idx])
 
         # Conclusões
-        conclusoes = [
-            "Viés de gênero foi detectado nos dados originais",
-            "A correção por reponderação mostrou-se eficaz",
-            "Redução significativa na diferença de médias entre gêneros",
-            "P-values indicam melhoria na equidade estatística",
-            "Mudanças no ranking refletem correção aplicada"
-        ]
-        self.slide_conclusoes(prs, conclusoes)
+        self.slide_conclusoes(prs, _CONCLUSOES)
 
         # Recomendações
-        recomendacoes = [
-            "Implementar correção de viés como prática padrão",
-            "Monitorar métricas de equidade periodicamente",
-            "Treinar avaliadores sobre vieses inconscientes",
-            "Revisar processos de avaliação regularmente",
-            "Documentar decisões e justificativas"
-        ]
-        self.slide_recomendacoes(prs, recomendacoes)
+        self.slide_recomendacoes(prs, _RECOMENDACOES)
 
         # Slide final
         self.slide_final(prs)
 
-        # Salva apresentação
-        prs.save(str(caminho))
-
-        print(f"\n✓ Apresentação PowerPoint salva: {caminho}")
-        print(f"  Total de slides: {len(prs.slides)}")
+        # Os PNGs já estão nas partes de imagem: libera as cópias lidas e as
+        # referências à apresentação guardadas no gerador antes de serializar,
+        # para que o deck não fique vivo (nem em dobro) enquanto é gravado
+        self._png_bytes = {}
+        self._layouts_prs = self._layouts = None
+        self._moldes = {}
+
+        # Salva apresentação: o ZIP é montado em memória (o python-pptx
+        # grava parte a parte) e vai para o disco numa única escrita, sem
+        # deixar arquivo pela metade se a serialização falhar
+        buffer = BytesIO()
+        prs.save(buffer)
+        caminho.write_bytes(buffer.getbuffer())
+
+        logger.info("\n✓ Apresentação PowerPoint salva: %s", caminho)
+        logger.info("  Total de slides: %d", len(prs.slides))
 
         return caminho
@@ -1,13 +1,141 @@
 """
 Gerador de dados mockados para testes do framework
 """
-import random
-from datetime import datetime, timedelta
-from typing import List
+import unicodedata
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
 from faker import Faker
 
 from src.models import Pessoa, Genero, NivelHierarquico
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Definições de cargos por nível
+_CARGOS_POR_NIVEL = {
+    NivelHierarquico.ESTAGIARIO: ["Estagiário"],
+    NivelHierarquico.JUNIOR: ["Analista Junior", "Desenvolvedor Junior", "Assistente"],
+    NivelHierarquico.PLENO: ["Analista Pleno", "Desenvolvedor Pleno", "Consultor Pleno"],
+    NivelHierarquico.SENIOR: ["Analista Senior", "Desenvolvedor Senior", "Consultor Senior"],
+    NivelHierarquico.ESPECIALISTA: ["Especialista", "Arquiteto", "Tech Lead"],
+    NivelHierarquico.COORDENADOR: ["Coordenador"],
+    NivelHierarquico.GERENTE: ["Gerente"],
+    NivelHierarquico.DIRETOR: ["Diretor"],
+    NivelHierarquico.VP: ["Vice-Presidente"],
+    NivelHierarquico.C_LEVEL: ["CEO", "CTO", "CFO", "COO"]
+}
+
+_DEPARTAMENTOS = (
+    "Tecnologia",
+    "Recursos Humanos",
+    "Financeiro",
+    "Comercial",
+    "Marketing",
+    "Operações",
+    "Produtos"
+)
+
+# Faixas de salário e idade por nível
+_SALARIO_BASE = {
+    NivelHierarquico.ESTAGIARIO: (1500, 2500),
+    NivelHierarquico.JUNIOR: (3000, 5000),
+    NivelHierarquico.PLENO: (5000, 8000),
+    NivelHierarquico.SENIOR: (8000, 12000),
+    NivelHierarquico.ESPECIALISTA: (12000, 18000),
+    NivelHierarquico.COORDENADOR: (10000, 15000),
+    NivelHierarquico.GERENTE: (15000, 25000),
+    NivelHierarquico.DIRETOR: (25000, 40000),
+    NivelHierarquico.VP: (40000, 60000),
+    NivelHierarquico.C_LEVEL: (60000, 100000)
+}
+_IDADE_BASE = {
+    NivelHierarquico.ESTAGIARIO: (18, 24),
+    NivelHierarquico.JUNIOR: (22, 28),
+    NivelHierarquico.PLENO: (26, 35),
+    NivelHierarquico.SENIOR: (30, 45),
+    NivelHierarquico.ESPECIALISTA: (32, 50),
+    NivelHierarquico.COORDENADOR: (30, 45),
+    NivelHierarquico.GERENTE: (35, 50),
+    NivelHierarquico.DIRETOR: (40, 60),
+    NivelHierarquico.VP: (45, 65),
+    NivelHierarquico.C_LEVEL: (45, 70)
+}
+
+# Distribuição piramidal: mais pessoas nos níveis inferiores
+_NIVEIS_PESOS = {
+    NivelHierarquico.ESTAGIARIO: 5,
+    NivelHierarquico.JUNIOR: 20,
+    NivelHierarquico.PLENO: 25,
+    NivelHierarquico.SENIOR: 20,
+    NivelHierarquico.ESPECIALISTA: 10,
+    NivelHierarquico.COORDENADOR: 8,
+    NivelHierarquico.GERENTE: 7,
+    NivelHierarquico.DIRETOR: 3,
+    NivelHierarquico.VP: 1,
+    NivelHierarquico.C_LEVEL: 1
+}
+
+# Tabelas indexadas pela posição do nível (value - 1), para os sorteios
+# vetorizados de gerar_pessoas
+_NIVEIS = tuple(NivelHierarquico)
+_PESOS_NIVEL = tuple(_NIVEIS_PESOS[nivel] for nivel in _NIVEIS)
+_SALARIOS_NIVEL = np.array([_SALARIO_BASE[nivel] for nivel in _NIVEIS], dtype=float)
+_IDADES_NIVEL = np.array([_IDADE_BASE[nivel] for nivel in _NIVEIS])
+_CARGOS_NIVEL = tuple(tuple(_CARGOS_POR_NIVEL[nivel]) for nivel in _NIVEIS)
+_QTD_CARGOS_NIVEL = np.array([len(cargos) for cargos in _CARGOS_NIVEL])
+
+# Quantidade de primeiros nomes (por gênero) e sobrenomes sorteados do Faker
+# para compor os nomes das pessoas
+_TAMANHO_POOL_NOMES = 1000
+
+# Pessoas sorteadas de uma vez por iter_pessoas
+_TAMANHO_BLOCO_PESSOAS = 10000
+
+
+def _tabela_alias(pesos: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Monta a tabela de alias (método de Vose) para sortear índices com os
+    pesos dados em O(1) por sorteio, independente do número de categorias
+
+    Returns:
+        (prob, alias): a posição i sorteada fica com i se um uniforme
+        for menor que prob[i], senão com alias[i]
+    """
+    quantidade = len(pesos)
+    escalados = np.asarray(pesos, dtype=float) * quantidade / np.sum(pesos)
+    prob = np.ones(quantidade)
+    alias = np.arange(quantidade)
+
+    pequenos = [i for i in range(quantidade) if escalados[i] < 1.0]
+    grandes = [i for i in range(quantidade) if escalados[i] >= 1.0]
+    while pequenos and grandes:
+        menor = pequenos.pop()
+        maior = grandes.pop()
+        prob[menor] = escalados[menor]
+        alias[menor] = maior
+        escalados[maior] += escalados[menor] - 1.0
+        (pequenos if escalados[maior] < 1.0 else grandes).append(maior)
+
+    # O que sobrar nas filas (só erro de arredondamento) fica com prob 1
+    return prob, alias
+
+
+def _sortear_alias(
+    rng: np.random.Generator,
+    tabela: Tuple[np.ndarray, np.ndarray],
+    quantidade: int
+) -> np.ndarray:
+    """Sorteia `quantidade` índices a partir de uma tabela de alias"""
+    prob, alias = tabela
+    indices = rng.integers(len(prob), size=quantidade)
+    return np.where(rng.random(quantidade) < prob[indices], indices, alias[indices])
+
+
+# Tabela de alias dos níveis, montada uma única vez para todos os geradores
+_TABELA_NIVEIS = _tabela_alias(_PESOS_NIVEL)
+
 
 class MockDataGenerator:
     """Classe para gerar dados mockados"""
@@ -21,7 +149,20 @@ class MockDataGenerator:
         """
         self.fake = Faker('pt_BR')
         Faker.seed(seed)
-        random.seed(seed)
+        # Todos os sorteios do gerador (PCG64), em lote sempre que possível
+        self.rng = np.random.default_rng(seed)
+        # Tabelas de alias já montadas, por distribuição de gênero
+        self._tabelas_genero = {}
+
+        # Pools de nomes sorteados uma única vez do Faker (~3 ms): os nomes
+        # das pessoas combinam primeiro nome e sobrenome sorteados destes
+        # pools, sem uma chamada ao Faker por pessoa. Sorteios repetidos
+        # preservam os pesos que o locale der a cada nome
+        self._primeiros_nomes = tuple(
+            [self.fake.first_name_female() for _ in range(_TAMANHO_POOL_NOMES)]
+            + [self.fake.first_name_male() for _ in range(_TAMANHO_POOL_NOMES)]
+        )
+        self._sobrenomes = tuple(self.fake.last_name() for _ in range(_TAMANHO_POOL_NOMES))
 
     def gerar_pessoas(
         self,
@@ -39,6 +180,119 @@ class MockDataGenerator:
         Returns:
             Lista de pessoas geradas
         """
+        atributos = self._sortear_atributos(quantidade, distribuicao_genero)
+        pessoas = list(self._montar_pessoas(atributos))
+
+        # Atribui gestores a partir das colunas sorteadas (sem reler o
+        # nível de cada Pessoa pelo enum)
+        gestores = self._sortear_gestores(atributos['ids'], atributos['indices_nivel'].tolist())
+        for pessoa, gestor_id in zip(pessoas, gestores):
+            pessoa.gestor_id = gestor_id
+
+        return pessoas
+
+    def iter_pessoas(
+        self,
+        quantidade: int = 50,
+        distribuicao_genero: dict = None,
+        tamanho_bloco: int = _TAMANHO_BLOCO_PESSOAS
+    ) -> Iterator[Pessoa]:
+        """
+        Gera as pessoas mockadas sob demanda, sorteando um bloco por vez,
+        para exportar ou validar populações grandes sem mantê-las em memória
+
+        As pessoas saem sem gestor (gestor_id=None): a atribuição depende de
+        conhecer a população inteira de cada nível. Use gerar_pessoas quando
+        precisar da hierarquia
+
+        Args:
+            quantidade: Número de pessoas a gerar
+            distribuicao_genero: Dicionário com distribuição de gênero
+                                Exemplo: {Genero.FEMININO: 0.5, Genero.MASCULINO: 0.5}
+            tamanho_bloco: Pessoas sorteadas por bloco
+
+        Yields:
+            Cada pessoa gerada
+        """
+        for inicio in range(0, quantidade, tamanho_bloco):
+            atributos = self._sortear_atributos(
+                min(tamanho_bloco, quantidade - inicio), distribuicao_genero, inicio + 1
+            )
+            yield from self._montar_pessoas(atributos)
+
+    def gerar_pessoas_frame(
+        self,
+        quantidade: int = 50,
+        distribuicao_genero: dict = None
+    ) -> 'pd.DataFrame':
+        """
+        Gera as pessoas mockadas direto em colunas, sem criar um objeto
+        Pessoa por linha (para populações grandes)
+
+        Args:
+            quantidade: Número de pessoas a gerar
+            distribuicao_genero: Dicionário com distribuição de gênero
+                                Exemplo: {Genero.FEMININO: 0.5, Genero.MASCULINO: 0.5}
+
+        Returns:
+            DataFrame com as colunas de Pessoa.to_dict; gênero, nível e
+            departamento como categóricos
+        """
+        import pandas as pd
+
+        atributos = self._sortear_atributos(quantidade, distribuicao_genero)
+        indices_nivel = atributos['indices_nivel']
+        ids = atributos['ids']
+        nomes = atributos['nomes']
+
+        return pd.DataFrame({
+            'id': ids,
+            'nome': nomes,
+            'genero': pd.Categorical(
+                [genero.value for genero in atributos['generos']],
+                categories=[genero.value for genero in Genero]
+            ),
+            'idade': atributos['idades'],
+            'cargo': [
+                _CARGOS_NIVEL[indice_nivel][indice_cargo]
+                for indice_nivel, indice_cargo in zip(
+                    indices_nivel.tolist(), atributos['indices_cargo'].tolist()
+                )
+            ],
+            'nivel_hierarquico': pd.Categorical.from_codes(
+                indices_nivel, categories=[nivel.name for nivel in _NIVEIS], ordered=True
+            ),
+            'nivel_hierarquico_valor': indices_nivel + 1,
+            'departamento': pd.Categorical.from_codes(
+                atributos['indices_departamento'], categories=list(_DEPARTAMENTOS)
+            ),
+            'tempo_empresa': atributos['tempos_empresa'],
+            'tempo_cargo_atual': atributos['tempos_cargo'],
+            'salario': atributos['salarios'],
+            'data_admissao': atributos['datas_admissao'],
+            'gestor_id': self._sortear_gestores(ids, indices_nivel.tolist()),
+            'email': [self._gerar_email(nome) for nome in nomes]
+        })
+
+    def _sortear_atributos(
+        self,
+        quantidade: int,
+        distribuicao_genero: dict = None,
+        primeiro_id: int = 1
+    ) -> dict:
+        """
+        Sorteia todos os atributos de uma vez (uma chamada numpy por
+        atributo em vez de várias chamadas ao random por pessoa)
+
+        Args:
+            quantidade: Número de pessoas a sortear
+            distribuicao_genero: Dicionário com distribuição de gênero
+            primeiro_id: Número do id da primeira pessoa (P0001 por padrão)
+
+        Returns:
+            Dicionário com uma lista ou array por atributo; nível, cargo e
+            departamento vêm como índices nas tabelas do módulo
+        """
         if distribuicao_genero is None:
             distribuicao_genero = {
                 Genero.FEMININO: 0.45,
@@ -47,96 +301,67 @@ class MockDataGenerator:
                 Genero.NAO_INFORMADO: 0.02
             }
 
-        pessoas = []
-
-        # Definições de cargos por nível
-        cargos_por_nivel = {
-            NivelHierarquico.ESTAGIARIO: ["Estagiário"],
-            NivelHierarquico.JUNIOR: ["Analista Junior", "Desenvolvedor Junior", "Assistente"],
-            NivelHierarquico.PLENO: ["Analista Pleno", "Desenvolvedor Pleno", "Consultor Pleno"],
-            NivelHierarquico.SENIOR: ["Analista Senior", "Desenvolvedor Senior", "Consultor Senior"],
-            NivelHierarquico.ESPECIALISTA: ["Especialista", "Arquiteto", "Tech Lead"],
-            NivelHierarquico.COORDENADOR: ["Coordenador"],
-            NivelHierarquico.GERENTE: ["Gerente"],
-            NivelHierarquico.DIRETOR: ["Diretor"],
-            NivelHierarquico.VP: ["Vice-Presidente"],
-            NivelHierarquico.C_LEVEL: ["CEO", "CTO", "CFO", "COO"]
+        generos = self._escolher_genero(distribuicao_genero, quantidade)
+        nomes = self._sortear_nomes(generos)
+        indices_nivel = self._escolher_nivel_hierarquico(quantidade)  # distribuição piramidal
+        indices_cargo = (
+            self.rng.random(quantidade) * _QTD_CARGOS_NIVEL[indices_nivel]
+        ).astype(np.intp)
+        indices_departamento = self.rng.integers(len(_DEPARTAMENTOS), size=quantidade)
+        tempos_empresa = self.rng.integers(6, 241, size=quantidade)  # 6 meses a 20 anos
+        tempos_cargo = self.rng.integers(3, np.minimum(tempos_empresa, 60) + 1)
+        salarios = np.round(self.rng.uniform(
+            _SALARIOS_NIVEL[indices_nivel, 0], _SALARIOS_NIVEL[indices_nivel, 1]
+        ), 2)
+        idades = self.rng.integers(
+            _IDADES_NIVEL[indices_nivel, 0], _IDADES_NIVEL[indices_nivel, 1] + 1
+        )
+        # Mesma referência de "agora" para todos (datetime64 em us vira
+        # datetime no tolist)
+        datas_admissao = (
+            np.datetime64(datetime.now(), 'us') - tempos_empresa * np.timedelta64(30, 'D')
+        )
+
+        return {
+            'ids': [f"P{i:04d}" for i in range(primeiro_id, primeiro_id + quantidade)],
+            'generos': generos,
+            'nomes': nomes,
+            'indices_nivel': indices_nivel,
+            'indices_cargo': indices_cargo,
+            'indices_departamento': indices_departamento,
+            'tempos_empresa': tempos_empresa,
+            'tempos_cargo': tempos_cargo,
+            'salarios': salarios,
+            'idades': idades,
+            'datas_admissao': datas_admissao
         }
 
-        departamentos = [
-            "Tecnologia",
-            "Recursos Humanos",
-            "Financeiro",
-            "Comercial",
-            "Marketing",
-            "Operações",
-            "Produtos"
-        ]
-
-        for i in range(quantidade):
-            # Determina gênero baseado na distribuição
-            genero = self._escolher_genero(distribuicao_genero)
-
-            # Gera nome baseado no gênero
-            if genero == Genero.FEMININO:
-                nome = self.fake.name_female()
-            elif genero == Genero.MASCULINO:
-                nome = self.fake.name_male()
-            else:
-                nome = self.fake.name()
-
-            # Determina nível hierárquico (distribuição piramidal)
-            nivel = self._escolher_nivel_hierarquico()
-
-            # Escolhe cargo baseado no nível
-            cargo = random.choice(cargos_por_nivel[nivel])
-
-            # Gera dados temporais
-            tempo_empresa = random.randint(6, 240)  # 6 meses a 20 anos
-            tempo_cargo_atual = random.randint(3, min(tempo_empresa, 60))
-            data_admissao = datetime.now() - timedelta(days=tempo_empresa * 30)
-
-            # Gera salário baseado no nível
-            salario_base = {
-                NivelHierarquico.ESTAGIARIO: (1500, 2500),
-                NivelHierarquico.JUNIOR: (3000, 5000),
-                NivelHierarquico.PLENO: (5000, 8000),
-                NivelHierarquico.SENIOR: (8000, 12000),
-                NivelHierarquico.ESPECIALISTA: (12000, 18000),
-                NivelHierarquico.COORDENADOR: (10000, 15000),
-                NivelHierarquico.GERENTE: (15000, 25000),
-                NivelHierarquico.DIRETOR: (25000, 40000),
-                NivelHierarquico.VP: (40000, 60000),
-                NivelHierarquico.C_LEVEL: (60000, 100000)
-            }
-            salario_min, salario_max = salario_base[nivel]
-            salario = round(random.uniform(salario_min, salario_max), 2)
-
-            # Gera idade compatível com o nível
-            idade_base = {
-                NivelHierarquico.ESTAGIARIO: (18, 24),
-                NivelHierarquico.JUNIOR: (22, 28),
-                NivelHierarquico.PLENO: (26, 35),
-                NivelHierarquico.SENIOR: (30, 45),
-                NivelHierarquico.ESPECIALISTA: (32, 50),
-                NivelHierarquico.COORDENADOR: (30, 45),
-                NivelHierarquico.GERENTE: (35, 50),
-                NivelHierarquico.DIRETOR: (40, 60),
-                NivelHierarquico.VP: (45, 65),
-                NivelHierarquico.C_LEVEL: (45, 70)
-            }
-            idade_min, idade_max = idade_base[nivel]
-            idade = random.randint(idade_min, idade_max)
-
-            # Cria a pessoa
-            pessoa = Pessoa(
-                id=f"P{i+1:04d}",
+    def _montar_pessoas(self, atributos: dict) -> Iterator[Pessoa]:
+        """Cria as pessoas a partir dos atributos sorteados por _sortear_atributos"""
+        # Tipos nativos do Python, não escalares numpy
+        colunas = zip(
+            atributos['ids'],
+            atributos['nomes'],
+            atributos['generos'],
+            atributos['indices_nivel'].tolist(),
+            atributos['indices_cargo'].tolist(),
+            atributos['indices_departamento'].tolist(),
+            atributos['tempos_empresa'].tolist(),
+            atributos['tempos_cargo'].tolist(),
+            atributos['salarios'].tolist(),
+            atributos['idades'].tolist(),
+            atributos['datas_admissao'].tolist()
+        )
+        for (id_pessoa, nome, genero, indice_nivel, indice_cargo, indice_departamento,
+             tempo_empresa, tempo_cargo_atual, salario, idade, data_admissao) in colunas:
+            yield Pessoa(
+                id=id_pessoa,
                 nome=nome,
                 genero=genero,
                 idade=idade,
-                cargo=cargo,
-                nivel_hierarquico=nivel,
-                departamento=random.choice(departamentos),
+                cargo=_CARGOS_NIVEL[indice_nivel][indice_cargo],
+                nivel_hierarquico=_NIVEIS[indice_nivel],
+                departamento=_DEPARTAMENTOS[indice_departamento],
                 tempo_empresa=tempo_empresa,
                 tempo_cargo_atual=tempo_cargo_atual,
                 salario=salario,
@@ -145,84 +370,107 @@ class MockDataGenerator:
                 email=self._gerar_email(nome)
             )
 
-            pessoas.append(pessoa)
+    def _escolher_genero(self, distribuicao: dict, quantidade: int) -> List[Genero]:
+        """
+        Sorteia `quantidade` gêneros baseado na distribuição (a sobra, se as
+        probabilidades somarem menos de 1, vai para NAO_INFORMADO)
+        """
+        chave = tuple(distribuicao.items())
+        if chave not in self._tabelas_genero:
+            generos = list(distribuicao) + [Genero.NAO_INFORMADO]
+
+            # Pesos efetivos do sorteio "primeiro gênero cujo acumulado alcança
+            # o uniforme": o acumulado é limitado a 1 e a sobra vai para o final
+            acumulado = np.minimum(np.cumsum(list(distribuicao.values())), 1.0)
+            pesos = np.diff(acumulado, prepend=0.0, append=1.0)
 
-        # Atribui gestores
-        self._atribuir_gestores(pessoas)
+            self._tabelas_genero[chave] = (generos, _tabela_alias(pesos))
 
-        return pessoas
+        generos, tabela = self._tabelas_genero[chave]
+        indices = _sortear_alias(self.rng, tabela, quantidade)
+        return [generos[indice] for indice in indices.tolist()]
 
-    def _escolher_genero(self, distribuicao: dict) -> Genero:
-        """Escolhe gênero baseado na distribuição"""
-        rand = random.random()
-        acumulado = 0
-
-        for genero, probabilidade in distribuicao.items():
-            acumulado += probabilidade
-            if rand <= acumulado:
-                return genero
-
-        return Genero.NAO_INFORMADO
-
-    def _escolher_nivel_hierarquico(self) -> NivelHierarquico:
-        """Escolhe nível hierárquico com distribuição piramidal"""
-        # Distribuição piramidal: mais pessoas nos níveis inferiores
-        niveis_pesos = {
-            NivelHierarquico.ESTAGIARIO: 5,
-            NivelHierarquico.JUNIOR: 20,
-            NivelHierarquico.PLENO: 25,
-            NivelHierarquico.SENIOR: 20,
-            NivelHierarquico.ESPECIALISTA: 10,
-            NivelHierarquico.COORDENADOR: 8,
-            NivelHierarquico.GERENTE: 7,
-            NivelHierarquico.DIRETOR: 3,
-            NivelHierarquico.VP: 1,
-            NivelHierarquico.C_LEVEL: 1
-        }
+    def _sortear_nomes(self, generos: List[Genero]) -> List[str]:
+        """
+        Sorteia um nome (primeiro nome e sobrenome) para cada gênero: nomes
+        femininos, masculinos ou de qualquer um dos dois para os demais
+        """
+        # Primeiros nomes femininos ocupam a primeira metade do pool
+        tamanho = _TAMANHO_POOL_NOMES
+        inicio = np.array([genero == Genero.MASCULINO for genero in generos]) * tamanho
+        fim = np.where(
+            np.array([genero == Genero.FEMININO for genero in generos]), tamanho, 2 * tamanho
+        )
+
+        indices_primeiro = self.rng.integers(inicio, fim)
+        indices_sobrenome = self.rng.integers(tamanho, size=len(generos))
+
+        return [
+            f"{self._primeiros_nomes[i]} {self._sobrenomes[j]}"
+            for i, j in zip(indices_primeiro.tolist(), indices_sobrenome.tolist())
+        ]
 
-        niveis = list(niveis_pesos.keys())
-        pesos = list(niveis_pesos.values())
+    def _escolher_nivel_hierarquico(self, quantidade: int) -> np.ndarray:
+        """
+        Sorteia `quantidade` níveis hierárquicos com distribuição piramidal
 
-        return random.choices(niveis, weights=pesos)[0]
+        Returns:
+            Posições dos níveis em NivelHierarquico (value - 1)
+        """
+        return _sortear_alias(self.rng, _TABELA_NIVEIS, quantidade)
 
     def _gerar_email(self, nome: str) -> str:
         """Gera email baseado no nome"""
-        # Remove acentos e espaços
         nome_limpo = nome.lower()
-        nome_limpo = nome_limpo.replace(' ', '.')
-
-        # Remove acentuação básica
-        acentos = {
-            'á': 'a', 'à': 'a', 'ã': 'a', 'â': 'a',
-            'é': 'e', 'ê': 'e',
-            'í': 'i',
-            'ó': 'o', 'õ': 'o', 'ô': 'o',
-            'ú': 'u', 'ü': 'u',
-            'ç': 'c'
-        }
 
-        for acento, letra in acentos.items():
-            nome_limpo = nome_limpo.replace(acento, letra)
+        # Remove acentos de qualquer alfabeto latino: decompõe (NFKD) e
+        # descarta as marcas combinantes. A maioria dos nomes já é ASCII
+        if not nome_limpo.isascii():
+            nome_limpo = (
+                unicodedata.normalize('NFKD', nome_limpo)
+                .encode('ascii', 'ignore')
+                .decode('ascii')
+            )
+
+        return f"{nome_limpo.replace(' ', '.')}@empresa.com"
+
+    def _sortear_gestores(self, ids: List[str], indices_nivel: List[int]) -> List[Optional[str]]:
+        """
+        Sorteia o gestor de cada pessoa entre as do nível ocupado mais
+        próximo acima do seu (None para quem está no nível mais alto)
+
+        Args:
+            ids: Ids das pessoas
+            indices_nivel: Posição do nível de cada pessoa (value - 1)
+
+        Returns:
+            Id do gestor de cada pessoa, na mesma ordem
+        """
+        gestores = [None] * len(ids)
 
-        return f"{nome_limpo}@empresa.com"
+        # Separa as posições das pessoas por nível numa única passada
+        por_nivel = [[] for _ in _NIVEIS]
+        for posicao, nivel in enumerate(indices_nivel):
+            por_nivel[nivel].append(posicao)
 
-    def _atribuir_gestores(self, pessoas: List[Pessoa]):
-        """Atribui gestores para as pessoas baseado na hierarquia"""
-        # Separa pessoas por nível
-        por_nivel = {}
-        for pessoa in pessoas:
-            nivel = pessoa.nivel_hierarquico.value
-            if nivel not in por_nivel:
-                por_nivel[nivel] = []
-            por_nivel[nivel].append(pessoa)
+        # Nível ocupado mais próximo acima de cada nível (None no topo)
+        acima = [None] * len(_NIVEIS)
+        proximo = None
+        for nivel in reversed(range(len(_NIVEIS))):
+            acima[nivel] = proximo
+            if por_nivel[nivel]:
+                proximo = nivel
 
         # Para cada nível, atribui gestores do nível superior
-        for nivel_valor in sorted(por_nivel.keys()):
-            # Procura gestores no próximo nível acima
-            for nivel_gestor in range(nivel_valor + 1, 11):
-                if nivel_gestor in por_nivel and len(por_nivel[nivel_gestor]) > 0:
-                    # Atribui gestores aleatoriamente
-                    gestores = por_nivel[nivel_gestor]
-                    for pessoa in por_nivel[nivel_valor]:
-                        pessoa.gestor_id = random.choice(gestores).id
-                    break
+        for nivel, subordinados in enumerate(por_nivel):
+            nivel_gestor = acima[nivel]
+            if not subordinados or nivel_gestor is None:
+                continue
+
+            # Atribui gestores aleatoriamente (um sorteio para o nível todo)
+            ids_gestores = [ids[posicao] for posicao in por_nivel[nivel_gestor]]
+            sorteados = self.rng.integers(len(ids_gestores), size=len(subordinados))
+            for posicao, indice in zip(subordinados, sorteados.tolist()):
+                gestores[posicao] = ids_gestores[indice]
+
+        return gestores